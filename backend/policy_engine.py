@@ -4,10 +4,10 @@ Solving Delhi's pollution crisis through intelligent intervention testing
 """
 
 import numpy as np
-import pandas as pd
 from typing import Dict, List, Tuple
 from dataclasses import dataclass
 from enum import Enum
+from datetime import datetime
 import json
 
 class InterventionType(Enum):
@@ -289,6 +289,25 @@ class ExposureAnalyzer:
             "lives_at_risk": int(lives_at_risk)
         }
     
+    def calculate_exposure_batch(self, aqi_matrix: np.ndarray) -> np.ndarray:
+        """Calculate lives at risk for a (K, zones) matrix of AQI scenarios"""
+        avg_aqi = np.asarray(aqi_matrix, dtype=float).mean(axis=1)
+        
+        groups = self.vulnerable_groups.values()
+        population = np.array([data["population"] for data in groups], dtype=float)
+        weight = np.array([data["exposure_hours"] * data["vulnerability"] / 24 for data in groups])
+        
+        # Same risk bands as calculate_exposure, evaluated for every scenario/group pair
+        exposure_index = avg_aqi[:, None] * weight[None, :]
+        affected_share = np.select(
+            [exposure_index > 200, exposure_index > 150, exposure_index > 100],
+            [0.15, 0.10, 0.05],
+            default=0.02
+        )
+        total_health_impact = (affected_share * population).sum(axis=1)
+        
+        return (total_health_impact * 0.001).astype(int)
+    
     def recommend_safe_hours(self, aqi_forecast: List[float]) -> Dict:
         """Recommend safe hours for outdoor activities"""
         safe_hours = []
@@ -439,38 +458,48 @@ class AIRecommendationEngine:
     def predict_intervention_outcome(self, intervention: PolicyIntervention, 
                                     current_state: Dict) -> Dict:
         """Predict the outcome of an intervention using ML models"""
-        
-        # Simulate intervention
-        impact = intervention.calculate_impact()
-        
-        # Calculate new AQI levels
-        new_aqi = {}
-        for zone in range(1, 6):
-            if zone in intervention.zones:
-                reduction = impact["aqi_reduction"]
-                new_aqi[zone] = max(50, current_state["aqi"][zone] - reduction)
-            else:
-                # Spillover effect
-                new_aqi[zone] = current_state["aqi"][zone] - impact["aqi_reduction"] * 0.2
+        return self.predict_intervention_outcomes([intervention], current_state)[0]
+    
+    def predict_intervention_outcomes(self, interventions: List[PolicyIntervention],
+                                      current_state: Dict) -> List[Dict]:
+        """Predict the outcomes of several candidate interventions in one pass"""
+        
+        zones = np.arange(1, 6)
+        current_aqi = np.array([current_state["aqi"][zone] for zone in zones], dtype=float)
+        
+        # Simulate interventions
+        impacts = [intervention.calculate_impact() for intervention in interventions]
+        reductions = np.array([impact["aqi_reduction"] for impact in impacts], dtype=float)
+        in_zone = np.array([np.isin(zones, intervention.zones) for intervention in interventions],
+                           dtype=bool).reshape(len(interventions), len(zones))
+        
+        # Calculate new AQI levels: full reduction in target zones, 20% spillover elsewhere
+        new_aqi = np.where(
+            in_zone,
+            np.maximum(50, current_aqi[None, :] - reductions[:, None]),
+            current_aqi[None, :] - reductions[:, None] * 0.2
+        )
         
         # Calculate exposure reduction
-        exposure_before = self.exposure_analyzer.calculate_exposure(current_state["aqi"])
-        exposure_after = self.exposure_analyzer.calculate_exposure(new_aqi)
-        
-        lives_saved = exposure_before["lives_at_risk"] - exposure_after["lives_at_risk"]
+        lives_before = self.exposure_analyzer.calculate_exposure_batch(current_aqi[None, :])[0]
+        lives_saved = lives_before - self.exposure_analyzer.calculate_exposure_batch(new_aqi)
+        
+        outcomes = []
+        for impact, aqi_row, saved in zip(impacts, new_aqi, lives_saved.tolist()):
+            outcomes.append({
+                "new_aqi": dict(zip(zones.tolist(), aqi_row.tolist())),
+                "aqi_reduction": impact["aqi_reduction"],
+                "lives_saved": saved,
+                "economic_impact": impact["economic_loss"],
+                "implementation_time": impact["implementation_time"],
+                "confidence_score": 0.85,
+                "side_effects": {
+                    "congestion_change": impact["congestion_increase"],
+                    "public_sentiment": "Positive" if saved > 10 else "Mixed"
+                }
+            })
         
-        return {
-            "new_aqi": new_aqi,
-            "aqi_reduction": impact["aqi_reduction"],
-            "lives_saved": lives_saved,
-            "economic_impact": impact["economic_loss"],
-            "implementation_time": impact["implementation_time"],
-            "confidence_score": 0.85,
-            "side_effects": {
-                "congestion_change": impact["congestion_increase"],
-                "public_sentiment": "Positive" if lives_saved > 10 else "Mixed"
-            }
-        }
+        return outcomes
 
 # API endpoints for the Flask backend
 def get_policy_recommendations(current_data: Dict) -> Dict:
@@ -488,14 +517,15 @@ def get_policy_recommendations(current_data: Dict) -> Dict:
     # Generate recommendations
     recommendations = engine.generate_recommendations(situation)
     
+    # Predict all outcomes in a single batch
+    outcomes = engine.predict_intervention_outcomes(
+        [rec["intervention"] for rec in recommendations],
+        {"aqi": current_data.get("aqi", {1: 220, 2: 200, 3: 240, 4: 210, 5: 230})}
+    )
+    
     # Format for frontend
     formatted_recs = []
-    for rec in recommendations:
-        outcome = engine.predict_intervention_outcome(
-            rec["intervention"],
-            {"aqi": current_data.get("aqi", {1: 220, 2: 200, 3: 240, 4: 210, 5: 230})}
-        )
-        
+    for rec, outcome in zip(recommendations, outcomes):
         formatted_recs.append({
             "id": len(formatted_recs) + 1,
             "name": rec["intervention"].type.value.replace("_", " ").title(),
@@ -516,7 +546,7 @@ def get_policy_recommendations(current_data: Dict) -> Dict:
     return {
         "situation_analysis": situation,
         "recommendations": formatted_recs,
-        "timestamp": pd.Timestamp.now().isoformat()
+        "timestamp": datetime.now().isoformat()
     }
 
 if __name__ == "__main__":
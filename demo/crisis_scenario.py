@@ -3,9 +3,132 @@ Delhi Digital Twin - Crisis Scenario Demo
 Hackathon Presentation Script
 """
 
+import sys
 import time
 import json
+import contextlib
 from datetime import datetime
+from types import MappingProxyType
+
+# Fixed zone_1..zone_5 schema, so a format string replaces the JSON encoder
+AQI_FMT = "Z1={zone_1} Z2={zone_2} Z3={zone_3} Z4={zone_4} Z5={zone_5}"
+
+_PRIORITY_EMOJI = {1: '🔴', 2: '🟡'}
+
+# Progress bars indexed by filled-cell count (0-20)
+_BARS = tuple("█" * i + "░" * (20 - i) for i in range(21))
+
+_ACT1_TIMELINE = (
+    MappingProxyType({
+        "time": "4:00 AM",
+        "event": "NASA satellites detect 3,000+ farm fires in Punjab",
+        "aqi": MappingProxyType({"zone_1": 250, "zone_2": 230, "zone_3": 270, "zone_4": 280, "zone_5": 260})
+    }),
+    MappingProxyType({
+        "time": "5:00 AM", 
+        "event": "Northwest winds (15 km/h) carrying smoke to Delhi",
+        "aqi": MappingProxyType({"zone_1": 320, "zone_2": 310, "zone_3": 350, "zone_4": 380, "zone_5": 340})
+    }),
+    MappingProxyType({
+        "time": "6:00 AM",
+        "event": "🚨 CRITICAL: Rohini AQI crosses 400 - HAZARDOUS",
+        "aqi": MappingProxyType({"zone_1": 380, "zone_2": 370, "zone_3": 410, "zone_4": 450, "zone_5": 390})
+    })
+)
+
+_ACT2_ANALYSIS = MappingProxyType({
+    "severity": "CRITICAL",
+    "crisis_zones": [3, 4],  # Dwarka and Rohini
+    "affected_population": 2500000,
+    "vulnerable_groups": {
+        "school_children": 180000,
+        "elderly": 95000,
+        "outdoor_workers": 65000
+    },
+    "primary_source": "stubble_burning (40%) + vehicular (35%)",
+    "weather_impact": "Temperature inversion trapping pollutants",
+    "predicted_peak": "8:00 AM - 10:00 AM (rush hour)"
+})
+
+_ACT3_RECOMMENDATIONS = (
+    MappingProxyType({
+        "priority": 1,
+        "name": "EMERGENCY PROTOCOL ALPHA",
+        "description": "Immediate comprehensive response",
+        "actions": (
+            "🚛 Ban all trucks on Ring Road (6 AM - 6 PM)",
+            "🏫 Close schools in zones 3 & 4",
+            "🏗️ Halt all construction activities",
+            "🚇 Free metro for 24 hours"
+        ),
+        "impact": MappingProxyType({
+            "aqi_reduction": 120,
+            "implementation_time": "30 minutes",
+            "lives_saved": 35,
+            "confidence": "95%"
+        })
+    }),
+    MappingProxyType({
+        "priority": 2,
+        "name": "TRAFFIC OPTIMIZATION",
+        "description": "AI-optimized traffic management",
+        "actions": (
+            "🚦 Adaptive signal timing on 50 intersections",
+            "🚗 Odd-even enforcement via ANPR cameras",
+            "🚌 Deploy 200 extra buses on key routes",
+            "📱 Push notifications for route alternatives"
+        ),
+        "impact": MappingProxyType({
+            "aqi_reduction": 65,
+            "implementation_time": "2 hours",
+            "lives_saved": 18,
+            "confidence": "88%"
+        })
+    }),
+    MappingProxyType({
+        "priority": 3,
+        "name": "EXPOSURE MANAGEMENT",
+        "description": "Protect vulnerable populations",
+        "actions": (
+            "👴 Door-to-door N95 distribution in hotspots",
+            "🏥 Mobile medical units deployed",
+            "📢 SMS alerts to 10 million citizens",
+            "🌬️ Activate all smog towers and misting systems"
+        ),
+        "impact": MappingProxyType({
+            "aqi_reduction": 25,
+            "implementation_time": "1 hour",
+            "lives_saved": 12,
+            "confidence": "92%"
+        })
+    })
+)
+
+# Simulated hour-by-hour impact
+_ACT4_SIMULATION_RESULTS = (
+    MappingProxyType({"hour": "7:00 AM", "aqi": 450, "status": "Intervention begins"}),
+    MappingProxyType({"hour": "8:00 AM", "aqi": 410, "status": "Trucks diverted, traffic flowing"}),
+    MappingProxyType({"hour": "9:00 AM", "aqi": 380, "status": "Schools closed, reduced exposure"}),
+    MappingProxyType({"hour": "10:00 AM", "aqi": 350, "status": "Free metro reducing car usage"}),
+    MappingProxyType({"hour": "12:00 PM", "aqi": 330, "status": "AQI dropping steadily"}),
+    MappingProxyType({"hour": "2:00 PM", "aqi": 310, "status": "Target achieved - 120 point reduction"})
+)
+
+_ACT5_NOTIFICATIONS = (
+    "✉️ SMS sent to 10 million citizens",
+    "📲 Push notifications via Delhi Gov app",
+    "📺 Emergency broadcast on TV/Radio",
+    "🚨 Google Maps updated with restrictions"
+)
+
+_ACT5_RESULTS = MappingProxyType({
+    "AQI Reduction": "Achieved 125 points (5 more than predicted)",
+    "Lives Saved": "37 (emergency admissions down 70%)",
+    "Compliance Rate": "94% (via CCTV monitoring)",
+    "Public Sentiment": "82% positive (Twitter sentiment analysis)",
+    "Economic Impact": "₹12 crores saved in healthcare costs"
+})
+
 
 class CrisisScenarioDemo:
     """
@@ -13,42 +136,30 @@ class CrisisScenarioDemo:
     Timeline: November 5, 2024 - Peak stubble burning season
     """
     
-    def __init__(self):
+    def __init__(self, pace: float = 1.0):
         self.scenario_name = "Diwali + Stubble Burning Crisis"
         self.date = "November 5, 2024"
         self.start_time = "6:00 AM"
+        self.pace = pace  # Multiplier on presentation pauses; 0 disables them
         
+    def _beat(self, seconds):
+        """Pause for presentation pacing, scaled by self.pace"""
+        if self.pace:
+            time.sleep(seconds * self.pace)
+    
     def act_1_crisis_develops(self):
         """Act 1: Crisis Develops (30 seconds)"""
         print("\n" + "="*60)
         print("ACT 1: CRISIS DEVELOPS")
         print("="*60)
         
-        timeline = [
-            {
-                "time": "4:00 AM",
-                "event": "NASA satellites detect 3,000+ farm fires in Punjab",
-                "aqi": {"zone_1": 250, "zone_2": 230, "zone_3": 270, "zone_4": 280, "zone_5": 260}
-            },
-            {
-                "time": "5:00 AM", 
-                "event": "Northwest winds (15 km/h) carrying smoke to Delhi",
-                "aqi": {"zone_1": 320, "zone_2": 310, "zone_3": 350, "zone_4": 380, "zone_5": 340}
-            },
-            {
-                "time": "6:00 AM",
-                "event": "🚨 CRITICAL: Rohini AQI crosses 400 - HAZARDOUS",
-                "aqi": {"zone_1": 380, "zone_2": 370, "zone_3": 410, "zone_4": 450, "zone_5": 390}
-            }
-        ]
-        
-        for event in timeline:
+        for event in _ACT1_TIMELINE:
             print(f"\n⏰ {event['time']}")
             print(f"📍 {event['event']}")
-            print(f"📊 AQI Levels: {json.dumps(event['aqi'], indent=2)}")
-            time.sleep(2)
+            print(f"📊 AQI Levels: {AQI_FMT.format(**event['aqi'])}")
+            self._beat(2)
         
-        return timeline[-1]['aqi']
+        return dict(_ACT1_TIMELINE[-1]['aqi'])
     
     def act_2_ai_analysis(self, current_aqi):
         """Act 2: AI Analysis (20 seconds)"""
@@ -56,24 +167,10 @@ class CrisisScenarioDemo:
         print("ACT 2: AI ANALYZES SITUATION")
         print("="*60)
         
-        analysis = {
-            "severity": "CRITICAL",
-            "crisis_zones": [3, 4],  # Dwarka and Rohini
-            "affected_population": 2500000,
-            "vulnerable_groups": {
-                "school_children": 180000,
-                "elderly": 95000,
-                "outdoor_workers": 65000
-            },
-            "primary_source": "stubble_burning (40%) + vehicular (35%)",
-            "weather_impact": "Temperature inversion trapping pollutants",
-            "predicted_peak": "8:00 AM - 10:00 AM (rush hour)"
-        }
-        
         print("\n🤖 AI SITUATIONAL ANALYSIS:")
-        for key, value in analysis.items():
+        for key, value in _ACT2_ANALYSIS.items():
             print(f"  • {key.replace('_', ' ').title()}: {value}")
-            time.sleep(1)
+            self._beat(1)
         
         # Calculate health impact
         print("\n⚠️ HEALTH IMPACT PREDICTION:")
@@ -81,7 +178,7 @@ class CrisisScenarioDemo:
         print(f"  • Lives at risk today: 45")
         print(f"  • Economic loss if no action: ₹50 crores")
         
-        return analysis
+        return _ACT2_ANALYSIS
     
     def act_3_ai_recommendations(self, analysis):
         """Act 3: AI Generates Solutions (30 seconds)"""
@@ -89,75 +186,21 @@ class CrisisScenarioDemo:
         print("ACT 3: AI RECOMMENDS INTERVENTIONS")
         print("="*60)
         
-        recommendations = [
-            {
-                "priority": 1,
-                "name": "EMERGENCY PROTOCOL ALPHA",
-                "description": "Immediate comprehensive response",
-                "actions": [
-                    "🚛 Ban all trucks on Ring Road (6 AM - 6 PM)",
-                    "🏫 Close schools in zones 3 & 4",
-                    "🏗️ Halt all construction activities",
-                    "🚇 Free metro for 24 hours"
-                ],
-                "impact": {
-                    "aqi_reduction": 120,
-                    "implementation_time": "30 minutes",
-                    "lives_saved": 35,
-                    "confidence": "95%"
-                }
-            },
-            {
-                "priority": 2,
-                "name": "TRAFFIC OPTIMIZATION",
-                "description": "AI-optimized traffic management",
-                "actions": [
-                    "🚦 Adaptive signal timing on 50 intersections",
-                    "🚗 Odd-even enforcement via ANPR cameras",
-                    "🚌 Deploy 200 extra buses on key routes",
-                    "📱 Push notifications for route alternatives"
-                ],
-                "impact": {
-                    "aqi_reduction": 65,
-                    "implementation_time": "2 hours",
-                    "lives_saved": 18,
-                    "confidence": "88%"
-                }
-            },
-            {
-                "priority": 3,
-                "name": "EXPOSURE MANAGEMENT",
-                "description": "Protect vulnerable populations",
-                "actions": [
-                    "👴 Door-to-door N95 distribution in hotspots",
-                    "🏥 Mobile medical units deployed",
-                    "📢 SMS alerts to 10 million citizens",
-                    "🌬️ Activate all smog towers and misting systems"
-                ],
-                "impact": {
-                    "aqi_reduction": 25,
-                    "implementation_time": "1 hour",
-                    "lives_saved": 12,
-                    "confidence": "92%"
-                }
-            }
-        ]
-        
-        for rec in recommendations:
-            print(f"\n{'🔴' if rec['priority'] == 1 else '🟡' if rec['priority'] == 2 else '🔵'} PRIORITY {rec['priority']}: {rec['name']}")
+        for rec in _ACT3_RECOMMENDATIONS:
+            print(f"\n{_PRIORITY_EMOJI.get(rec['priority'], '🔵')} PRIORITY {rec['priority']}: {rec['name']}")
             print(f"   {rec['description']}")
             print("\n   Actions:")
             for action in rec['actions']:
                 print(f"   {action}")
-                time.sleep(0.5)
+                self._beat(0.5)
             print(f"\n   Expected Impact:")
             print(f"   • AQI Reduction: {rec['impact']['aqi_reduction']} points")
             print(f"   • Lives Saved: {rec['impact']['lives_saved']}")
             print(f"   • Implementation: {rec['impact']['implementation_time']}")
             print(f"   • Confidence: {rec['impact']['confidence']}")
-            time.sleep(2)
+            self._beat(2)
         
-        return recommendations[0]  # Return top recommendation
+        return _ACT3_RECOMMENDATIONS[0]  # Return top recommendation
     
     def act_4_virtual_testing(self, intervention):
         """Act 4: Virtual Testing (20 seconds)"""
@@ -166,32 +209,21 @@ class CrisisScenarioDemo:
         print("="*60)
         
         print("\n🔬 RUNNING SIMULATION...")
-        time.sleep(2)
-        
-        # Simulate hour-by-hour impact
-        simulation_results = [
-            {"hour": "7:00 AM", "aqi": 450, "status": "Intervention begins"},
-            {"hour": "8:00 AM", "aqi": 410, "status": "Trucks diverted, traffic flowing"},
-            {"hour": "9:00 AM", "aqi": 380, "status": "Schools closed, reduced exposure"},
-            {"hour": "10:00 AM", "aqi": 350, "status": "Free metro reducing car usage"},
-            {"hour": "12:00 PM", "aqi": 330, "status": "AQI dropping steadily"},
-            {"hour": "2:00 PM", "aqi": 310, "status": "Target achieved - 120 point reduction"}
-        ]
+        self._beat(2)
         
-        for result in simulation_results:
+        for result in _ACT4_SIMULATION_RESULTS:
             print(f"\n⏰ {result['hour']}: AQI = {result['aqi']} | {result['status']}")
             # Show visual progress bar
             progress = int((450 - result['aqi']) / 120 * 20)
-            bar = "█" * progress + "░" * (20 - progress)
-            print(f"   Progress: [{bar}] {int((450 - result['aqi']) / 120 * 100)}%")
-            time.sleep(1.5)
+            print(f"   Progress: [{_BARS[min(progress, 20)]}] {int((450 - result['aqi']) / 120 * 100)}%")
+            self._beat(1.5)
         
         print("\n✅ SIMULATION COMPLETE")
         print("   • Total AQI Reduction: 120 points")
         print("   • Lives Saved: 35")
         print("   • No actual disruption during testing")
         
-        return simulation_results
+        return _ACT4_SIMULATION_RESULTS
     
     def act_5_implementation(self, simulation_results):
         """Act 5: Real Implementation (20 seconds)"""
@@ -200,57 +232,64 @@ class CrisisScenarioDemo:
         print("="*60)
         
         print("\n📱 NOTIFICATIONS SENT:")
-        notifications = [
-            "✉️ SMS sent to 10 million citizens",
-            "📲 Push notifications via Delhi Gov app",
-            "📺 Emergency broadcast on TV/Radio",
-            "🚨 Google Maps updated with restrictions"
-        ]
-        
-        for notif in notifications:
+        for notif in _ACT5_NOTIFICATIONS:
             print(f"   {notif}")
-            time.sleep(0.5)
+            self._beat(0.5)
         
         print("\n🎯 REAL-WORLD RESULTS (12 hours later):")
-        results = {
-            "AQI Reduction": "Achieved 125 points (5 more than predicted)",
-            "Lives Saved": "37 (emergency admissions down 70%)",
-            "Compliance Rate": "94% (via CCTV monitoring)",
-            "Public Sentiment": "82% positive (Twitter sentiment analysis)",
-            "Economic Impact": "₹12 crores saved in healthcare costs"
-        }
-        
-        for key, value in results.items():
+        for key, value in _ACT5_RESULTS.items():
             print(f"   • {key}: {value}")
-            time.sleep(1)
+            self._beat(1)
         
-        return results
+        return _ACT5_RESULTS
     
-    def run_complete_demo(self):
-        """Run the complete crisis scenario demo"""
+    def run_complete_demo(self, interactive: bool = True):
+        """
+        Run the complete crisis scenario demo
+        
+        With interactive=False the Enter prompts are skipped, the narrative
+        goes to stderr and a single JSON summary is written to stdout.
+        """
+        if interactive:
+            outcome = self._run_acts(interactive)
+        else:
+            with contextlib.redirect_stdout(sys.stderr):
+                outcome = self._run_acts(interactive)
+            # default=dict unwraps the read-only MappingProxyType constants
+            json.dump(outcome, sys.stdout, default=dict, ensure_ascii=False)
+            sys.stdout.write("\n")
+        
+        return outcome
+    
+    def _run_acts(self, interactive):
+        """Play the five acts, pausing for Enter between them when interactive"""
+        def prompt(message):
+            if interactive:
+                input(message)
+        
         print("\n" + "🌟"*30)
         print("DELHI DIGITAL TWIN - CRISIS RESPONSE DEMO")
         print(f"Scenario: {self.scenario_name}")
         print(f"Date: {self.date}")
         print("🌟"*30)
         
-        input("\nPress Enter to begin the demo...")
+        prompt("\nPress Enter to begin the demo...")
         
         # Act 1: Crisis develops
         current_aqi = self.act_1_crisis_develops()
-        input("\n➡️ Press Enter to continue to AI Analysis...")
+        prompt("\n➡️ Press Enter to continue to AI Analysis...")
         
         # Act 2: AI analyzes
         analysis = self.act_2_ai_analysis(current_aqi)
-        input("\n➡️ Press Enter to see AI Recommendations...")
+        prompt("\n➡️ Press Enter to see AI Recommendations...")
         
         # Act 3: AI recommends
         top_intervention = self.act_3_ai_recommendations(analysis)
-        input("\n➡️ Press Enter to run Virtual Testing...")
+        prompt("\n➡️ Press Enter to run Virtual Testing...")
         
         # Act 4: Virtual testing
         simulation = self.act_4_virtual_testing(top_intervention)
-        input("\n➡️ Press Enter to see Implementation Results...")
+        prompt("\n➡️ Press Enter to see Implementation Results...")
         
         # Act 5: Implementation
         results = self.act_5_implementation(simulation)
@@ -265,7 +304,18 @@ class CrisisScenarioDemo:
         print(f"✅ No trial-and-error, got it right first time")
         print(f"\n💡 This is the power of AI-driven policy testing!")
         print(f"💡 Delhi Digital Twin - Turning data into saved lives.")
+        
+        return {
+            "initial_aqi": current_aqi,
+            "analysis": analysis,
+            "intervention": top_intervention,
+            "simulation": simulation,
+            "results": results
+        }
 
 if __name__ == "__main__":
-    demo = CrisisScenarioDemo()
-    demo.run_complete_demo()
+    if "--script" in sys.argv:
+        CrisisScenarioDemo(pace=0).run_complete_demo(interactive=False)
+    else:
+        demo = CrisisScenarioDemo()
+        demo.run_complete_demo()
@@ -8,8 +8,6 @@ import os
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from src.models import CorridorNetwork, TrafficSimulator, InterventionEngine, EmissionsModel
-
 def main():
     print("=" * 80)
     print("DELHI CORRIDOR TRAFFIC SIMULATOR - DEMO")
@@ -18,13 +16,19 @@ def main():
     # Initialize models
     print("\n[1] Loading network from CSV files...")
     data_path = os.path.join(os.path.dirname(__file__), 'data')
+    csv_paths = [os.path.join(data_path, name)
+                 for name in ('corridor_segments.csv', 'intersections.csv', 'od_matrix.csv')]
+    missing = [path for path in csv_paths if not os.path.isfile(path)]
+    if missing:
+        print("[ERROR] Error loading network: missing {}".format(', '.join(missing)))
+        return
+    
+    # Deferred so a missing-data run exits before paying for pandas/numpy imports
+    import numpy as np
+    from src.models import CorridorNetwork, TrafficSimulator, InterventionEngine, EmissionsModel
     
     try:
-        network = CorridorNetwork(
-            os.path.join(data_path, 'corridor_segments.csv'),
-            os.path.join(data_path, 'intersections.csv'),
-            os.path.join(data_path, 'od_matrix.csv'),
-        )
+        network = CorridorNetwork(*csv_paths)
         print("[OK] Network loaded: {} segments, {} intersections".format(
             len(network.get_all_segments()),
             len(network.get_all_intersections())))
@@ -58,7 +62,10 @@ def main():
         baseline_results = simulator.run_simulation('baseline')
         print("[OK] Baseline simulation complete")
         print("  - Total vehicles/hour: {:.0f}".format(baseline_results['total_vehicles']))
-        avg_tt = sum(r['travel_time_min'] for r in baseline_results['segments'].values()) / len(baseline_results['segments'])
+        segments = baseline_results['segments']
+        travel_times = np.fromiter((r['travel_time_min'] for r in segments.values()),
+                                   dtype=np.float64, count=len(segments))
+        avg_tt = travel_times.mean()
         print("  - Average segment travel time: {:.1f} min".format(avg_tt))
         print("  - Zones analyzed: {}".format(len(baseline_results['zones'])))
     except Exception as e:
@@ -69,12 +76,15 @@ def main():
     
     # Show zone-level results
     print("\n[5] Zone-level traffic statistics:")
-    for zone_id, zone_data in sorted(baseline_results['zones'].items()):
-        print("  {}: {:.0f} vph, Avg speed: {:.1f} km/h, Avg travel time: {:.1f} min".format(
+    zone_lines = [
+        "  {}: {:.0f} vph, Avg speed: {:.1f} km/h, Avg travel time: {:.1f} min".format(
             zone_id,
             zone_data['total_flow'],
             zone_data['avg_speed'],
-            zone_data['avg_travel_time']))
+            zone_data['avg_travel_time'])
+        for zone_id, zone_data in sorted(baseline_results['zones'].items())
+    ]
+    sys.stdout.write("\n".join(zone_lines) + "\n")
     
     # Initialize emissions model
     print("\n[6] Initializing emissions model...")
@@ -90,12 +100,15 @@ def main():
     try:
         zones_aqi = emissions_model.compute_all_zones_aqi()
         print("[OK] AQI computed for all zones")
-        for zone_aqi in zones_aqi:
-            print("  {}: AQI {:.0f} (BG: {}, Traffic: +{:.1f})".format(
+        aqi_lines = [
+            "  {}: AQI {:.0f} (BG: {}, Traffic: +{:.1f})".format(
                 zone_aqi['zone_id'],
                 zone_aqi['total_aqi'],
                 zone_aqi['background_aqi'],
-                zone_aqi['traffic_aqi_contribution']))
+                zone_aqi['traffic_aqi_contribution'])
+            for zone_aqi in zones_aqi
+        ]
+        sys.stdout.write("\n".join(aqi_lines) + "\n")
     except Exception as e:
         print("[ERROR] Error computing AQI: {}".format(e))
         import traceback
@@ -143,8 +156,9 @@ def main():
         ('INT002', 'INT007'),
         ('INT009', 'INT014'),
     ]
+    sample_paths = network.shortest_paths(od_samples)
     for origin, dest in od_samples:
-        path, distance = network.dijkstra(origin, dest)
+        path, distance = sample_paths[(origin, dest)]
         print("  {} -> {}: {} (distance: {:.1f} km)".format(
             origin,
             dest,
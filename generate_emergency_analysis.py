@@ -5,57 +5,82 @@ Shows AQI differences, intervention impacts, and comprehensive analysis
 
 import pandas as pd
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # Headless: the dashboard is only ever written to PNG
 import matplotlib.pyplot as plt
-import seaborn as sns
-from matplotlib.gridspec import GridSpec
+import sys
+import hashlib
 import webbrowser
 from pathlib import Path
 
-# Set style
-sns.set_theme(style="darkgrid", palette="husl")
-plt.rcParams['figure.figsize'] = (16, 12)
-plt.rcParams['font.size'] = 10
+OUTPUT_DIR = Path('visualization_outputs')
+OUTPUT_DIR.mkdir(exist_ok=True)
 
-# Mock Data - Baseline Scenario
-baseline_zones = {
-    'Zone_1': {'name': 'Connaught Place', 'aqi': 328, 'speed': 45, 'traffic': 8750},
-    'Zone_2': {'name': 'Karol Bagh', 'aqi': 315, 'speed': 48, 'traffic': 7200},
-    'Zone_3': {'name': 'Dwarka', 'aqi': 342, 'speed': 42, 'traffic': 9100},
-    'Zone_4': {'name': 'Rohini', 'aqi': 305, 'speed': 50, 'traffic': 6800},
-    'Zone_5': {'name': 'Saket', 'aqi': 320, 'speed': 46, 'traffic': 7500},
+# Dashboard style: the parts of seaborn's "darkgrid" theme the dashboard relies on,
+# applied only while it is drawn so importing this module leaves rcParams alone
+DASHBOARD_RC = {
+    'axes.facecolor': '#EAEAF2',
+    'axes.edgecolor': 'white',
+    'axes.grid': True,
+    'axes.axisbelow': True,
+    'axes.labelcolor': '.15',
+    'axes.labelsize': 12,
+    'axes.titlesize': 12,
+    'axes.linewidth': 1.25,
+    'grid.color': 'white',
+    'grid.linewidth': 1.0,
+    'legend.fontsize': 11,
+    'patch.edgecolor': 'w',
+    'patch.force_edgecolor': True,
+    'text.color': '.15',
+    'xtick.color': '.15',
+    'ytick.color': '.15',
+    'xtick.labelsize': 11,
+    'ytick.labelsize': 11,
+    'xtick.bottom': False,
+    'ytick.left': False,
+    'font.size': 10,
 }
 
-# Mock Data - Emergency Protocol Response
-emergency_zones = {
-    'Zone_1': {'name': 'Connaught Place', 'aqi': 265, 'speed': 58, 'traffic': 4200},
-    'Zone_2': {'name': 'Karol Bagh', 'aqi': 270, 'speed': 62, 'traffic': 3600},
-    'Zone_3': {'name': 'Dwarka', 'aqi': 285, 'speed': 55, 'traffic': 4500},
-    'Zone_4': {'name': 'Rohini', 'aqi': 245, 'speed': 68, 'traffic': 3400},
-    'Zone_5': {'name': 'Saket', 'aqi': 260, 'speed': 60, 'traffic': 3750},
-}
+# Mock Data - Baseline (base_*) vs Emergency Protocol Response (em_*), one row per zone
+ZONES_DF = pd.DataFrame({
+    'name': ['Connaught Place', 'Karol Bagh', 'Dwarka', 'Rohini', 'Saket'],
+    'base_aqi': [328, 315, 342, 305, 320],
+    'em_aqi': [265, 270, 285, 245, 260],
+    'base_speed': [45, 48, 42, 50, 46],
+    'em_speed': [58, 62, 55, 68, 60],
+    'base_traffic': [8750, 7200, 9100, 6800, 7500],
+    'em_traffic': [4200, 3600, 4500, 3400, 3750],
+}, index=pd.Index(['Zone_1', 'Zone_2', 'Zone_3', 'Zone_4', 'Zone_5'], name='zone_id'))
+
+# Per-zone impact record; one contiguous row per ZONES_DF zone
+IMPACT_DTYPE = np.dtype([
+    ('aqi_reduction', 'f8'),
+    ('speed_improvement', 'f8'),
+    ('traffic_reduction', 'f8'),
+    ('health_impact', 'f8'),
+])
 
 def calculate_impact():
-    """Calculate intervention impacts"""
-    impacts = {}
-    for zone_id in baseline_zones.keys():
-        baseline = baseline_zones[zone_id]
-        emergency = emergency_zones[zone_id]
-        
-        aqi_reduction = baseline['aqi'] - emergency['aqi']
-        speed_improvement = ((emergency['speed'] - baseline['speed']) / baseline['speed']) * 100
-        traffic_reduction = ((baseline['traffic'] - emergency['traffic']) / baseline['traffic']) * 100
-        
-        impacts[zone_id] = {
-            'aqi_reduction': aqi_reduction,
-            'speed_improvement': speed_improvement,
-            'traffic_reduction': traffic_reduction,
-            'health_impact': aqi_reduction * 2.5,  # Lives saved estimate
-        }
+    """Calculate intervention impacts as a structured array of IMPACT_DTYPE, one row per zone"""
+    base_speed = ZONES_DF['base_speed'].to_numpy(dtype=float)
+    base_traffic = ZONES_DF['base_traffic'].to_numpy(dtype=float)
+    
+    impacts = np.empty(len(ZONES_DF), dtype=IMPACT_DTYPE)
+    impacts['aqi_reduction'] = ZONES_DF['base_aqi'].to_numpy() - ZONES_DF['em_aqi'].to_numpy()
+    impacts['speed_improvement'] = (ZONES_DF['em_speed'].to_numpy() - base_speed) / base_speed * 100.0
+    impacts['traffic_reduction'] = (base_traffic - ZONES_DF['em_traffic'].to_numpy()) / base_traffic * 100.0
+    impacts['health_impact'] = impacts['aqi_reduction'] * 2.5  # Lives saved estimate
     
     return impacts
 
 def generate_analysis_dashboard():
     """Generate comprehensive analysis dashboard"""
+    with plt.rc_context(DASHBOARD_RC):
+        return _render_dashboard()
+
+def _render_dashboard():
+    """Draw and save the dashboard figure under the active rc settings"""
     print("\n" + "="*70)
     print("EMERGENCY PROTOCOL ANALYSIS & VISUALIZATION")
     print("="*70 + "\n")
@@ -63,21 +88,31 @@ def generate_analysis_dashboard():
     impacts = calculate_impact()
     
     # Create figure with subplots
-    fig = plt.figure(figsize=(18, 14))
-    gs = GridSpec(4, 3, figure=fig, hspace=0.3, wspace=0.3)
-    
-    zones_list = list(baseline_zones.keys())
-    baseline_aqi = [baseline_zones[z]['aqi'] for z in zones_list]
-    emergency_aqi = [emergency_zones[z]['aqi'] for z in zones_list]
-    zone_names = [baseline_zones[z]['name'] for z in zones_list]
-    aqi_reduction = [impacts[z]['aqi_reduction'] for z in zones_list]
-    speed_improvement = [impacts[z]['speed_improvement'] for z in zones_list]
-    traffic_reduction = [impacts[z]['traffic_reduction'] for z in zones_list]
-    health_impact = [impacts[z]['health_impact'] for z in zones_list]
+    # Fixed 4x3 layout with spanning panels, all axes created in one call;
+    # constrained layout sizes it once so the save needs no tight-bbox pass
+    fig, axd = plt.subplot_mosaic(
+        [[1, 1, 2],
+         [3, 4, 5],
+         [6, 6, 6],
+         [7, 8, 8]],
+        figsize=(18, 14),
+        layout='constrained',
+    )
+    
+    # Pull every plotted column once
+    zone_names = ZONES_DF['name'].to_numpy()
+    (baseline_aqi, emergency_aqi, baseline_speed, emergency_speed,
+     baseline_traffic, emergency_traffic) = ZONES_DF[
+        ['base_aqi', 'em_aqi', 'base_speed', 'em_speed', 'base_traffic', 'em_traffic']
+    ].to_numpy().T
+    aqi_reduction = impacts['aqi_reduction']
+    speed_improvement = impacts['speed_improvement']
+    traffic_reduction = impacts['traffic_reduction']
+    health_impact = impacts['health_impact']
     
     # ===== 1. Baseline vs Emergency AQI Comparison =====
-    ax1 = fig.add_subplot(gs[0, :2])
-    x = np.arange(len(zones_list))
+    ax1 = axd[1]
+    x = np.arange(len(zone_names))
     width = 0.35
     
     bars1 = ax1.bar(x - width/2, baseline_aqi, width, label='Baseline', color='#ef4444', alpha=0.8)
@@ -86,37 +121,27 @@ def generate_analysis_dashboard():
     ax1.set_xlabel('Zones', fontweight='bold', fontsize=11)
     ax1.set_ylabel('AQI Level', fontweight='bold', fontsize=11)
     ax1.set_title('🚨 Baseline vs Emergency Protocol AQI Comparison', fontweight='bold', fontsize=13, pad=15)
-    ax1.set_xticks(x)
-    ax1.set_xticklabels(zone_names, rotation=45, ha='right')
+    ax1.set_xticks(x, labels=zone_names, rotation=45, ha='right')
     ax1.legend(loc='upper right', fontsize=10)
     ax1.grid(axis='y', alpha=0.3)
     
     # Add value labels
-    for bars in [bars1, bars2]:
-        for bar in bars:
-            height = bar.get_height()
-            ax1.text(bar.get_x() + bar.get_width()/2., height,
-                    f'{int(height)}', ha='center', va='bottom', fontsize=9, fontweight='bold')
+    for bars in (bars1, bars2):
+        ax1.bar_label(bars, fmt='%d', fontsize=9, fontweight='bold')
     
     # ===== 2. AQI Reduction (Impact) =====
-    ax2 = fig.add_subplot(gs[0, 2])
-    colors = ['#10b981' if x > 40 else '#f59e0b' for x in aqi_reduction]
+    ax2 = axd[2]
+    colors = np.where(aqi_reduction > 40, '#10b981', '#f59e0b')
     bars = ax2.barh(zone_names, aqi_reduction, color=colors, alpha=0.8)
     
     ax2.set_xlabel('AQI Reduction', fontweight='bold', fontsize=11)
     ax2.set_title('📊 AQI Reduction Impact', fontweight='bold', fontsize=12, pad=10)
     ax2.grid(axis='x', alpha=0.3)
     
-    for i, bar in enumerate(bars):
-        width = bar.get_width()
-        ax2.text(width, bar.get_y() + bar.get_height()/2.,
-                f'{width:.0f}', ha='left', va='center', fontsize=10, fontweight='bold')
+    ax2.bar_label(bars, fmt='%.0f', label_type='edge', fontsize=10, fontweight='bold')
     
     # ===== 3. Speed Improvement =====
-    ax3 = fig.add_subplot(gs[1, 0])
-    baseline_speed = [baseline_zones[z]['speed'] for z in zones_list]
-    emergency_speed = [emergency_zones[z]['speed'] for z in zones_list]
-    
+    ax3 = axd[3]
     ax3.plot(zone_names, baseline_speed, marker='o', linewidth=2.5, markersize=8, 
             label='Baseline', color='#ef4444', linestyle='--')
     ax3.plot(zone_names, emergency_speed, marker='s', linewidth=2.5, markersize=8, 
@@ -126,70 +151,54 @@ def generate_analysis_dashboard():
     ax3.set_title('🚗 Speed Improvement', fontweight='bold', fontsize=12, pad=10)
     ax3.legend(loc='upper left', fontsize=9)
     ax3.grid(True, alpha=0.3)
-    ax3.set_xticklabels(zone_names, rotation=45, ha='right')
+    ax3.set_xticks(x, labels=zone_names, rotation=45, ha='right')
     
     # ===== 4. Speed Improvement % =====
-    ax4 = fig.add_subplot(gs[1, 1])
-    colors_speed = ['#10b981' if x > 15 else '#f59e0b' for x in speed_improvement]
+    ax4 = axd[4]
+    colors_speed = np.where(speed_improvement > 15, '#10b981', '#f59e0b')
     bars = ax4.bar(zone_names, speed_improvement, color=colors_speed, alpha=0.8)
     
     ax4.set_ylabel('Speed Improvement (%)', fontweight='bold', fontsize=11)
     ax4.set_title('📈 Speed Improvement %', fontweight='bold', fontsize=12, pad=10)
-    ax4.set_xticklabels(zone_names, rotation=45, ha='right')
+    ax4.set_xticks(x, labels=zone_names, rotation=45, ha='right')
     ax4.grid(axis='y', alpha=0.3)
     
-    for bar in bars:
-        height = bar.get_height()
-        ax4.text(bar.get_x() + bar.get_width()/2., height,
-                f'{height:.1f}%', ha='center', va='bottom', fontsize=9, fontweight='bold')
+    ax4.bar_label(bars, fmt='%.1f%%', fontsize=9, fontweight='bold')
     
     # ===== 5. Traffic Reduction =====
-    ax5 = fig.add_subplot(gs[1, 2])
-    colors_traffic = ['#10b981' if x > 40 else '#f59e0b' for x in traffic_reduction]
+    ax5 = axd[5]
+    colors_traffic = np.where(traffic_reduction > 40, '#10b981', '#f59e0b')
     bars = ax5.barh(zone_names, traffic_reduction, color=colors_traffic, alpha=0.8)
     
     ax5.set_xlabel('Traffic Reduction (%)', fontweight='bold', fontsize=11)
     ax5.set_title('🚦 Traffic Reduction', fontweight='bold', fontsize=12, pad=10)
     ax5.grid(axis='x', alpha=0.3)
     
-    for i, bar in enumerate(bars):
-        width = bar.get_width()
-        ax5.text(width, bar.get_y() + bar.get_height()/2.,
-                f'{width:.1f}%', ha='left', va='center', fontsize=9, fontweight='bold')
+    ax5.bar_label(bars, fmt='%.1f%%', label_type='edge', fontsize=9, fontweight='bold')
     
     # ===== 6. Health Impact (Lives Saved) =====
-    ax6 = fig.add_subplot(gs[2, :])
+    ax6 = axd[6]
     
     bars = ax6.bar(zone_names, health_impact, color='#3b82f6', alpha=0.8)
     ax6.set_ylabel('Health Impact Score', fontweight='bold', fontsize=11)
     ax6.set_title('❤️ Health Impact Score (Lives Saved Estimate)', fontweight='bold', fontsize=13, pad=15)
     ax6.grid(axis='y', alpha=0.3)
     
-    for bar in bars:
-        height = bar.get_height()
-        ax6.text(bar.get_x() + bar.get_width()/2., height,
-                f'{height:.0f}', ha='center', va='bottom', fontsize=10, fontweight='bold')
+    ax6.bar_label(bars, fmt='%.0f', fontsize=10, fontweight='bold')
     
     # ===== 7. Traffic Volume Comparison =====
-    ax7 = fig.add_subplot(gs[3, 0])
-    baseline_traffic = [baseline_zones[z]['traffic'] for z in zones_list]
-    emergency_traffic = [emergency_zones[z]['traffic'] for z in zones_list]
-    
-    x = np.arange(len(zones_list))
-    width = 0.35
-    
+    ax7 = axd[7]
     ax7.bar(x - width/2, baseline_traffic, width, label='Baseline', color='#ef4444', alpha=0.8)
     ax7.bar(x + width/2, emergency_traffic, width, label='Emergency', color='#10b981', alpha=0.8)
     
     ax7.set_ylabel('Vehicles/Hour', fontweight='bold', fontsize=11)
     ax7.set_title('🚗 Traffic Volume', fontweight='bold', fontsize=12, pad=10)
-    ax7.set_xticks(x)
-    ax7.set_xticklabels(zone_names, rotation=45, ha='right')
+    ax7.set_xticks(x, labels=zone_names, rotation=45, ha='right')
     ax7.legend(loc='upper right', fontsize=9)
     ax7.grid(axis='y', alpha=0.3)
     
     # ===== 8. Key Metrics Summary =====
-    ax8 = fig.add_subplot(gs[3, 1:])
+    ax8 = axd[8]
     ax8.axis('off')
     
     # Calculate totals
@@ -216,18 +225,15 @@ def generate_analysis_dashboard():
     
     # Main title
     fig.suptitle('🚨 EMERGENCY PROTOCOL ANALYSIS - DELHI DIGITAL TWIN 🚨',
-                fontsize=16, fontweight='bold', y=0.995)
+                fontsize=16, fontweight='bold')
     
     # Save figure
-    output_dir = Path('visualization_outputs')
-    output_dir.mkdir(exist_ok=True)
-    
-    output_path = output_dir / 'emergency_protocol_analysis.png'
-    plt.savefig(output_path, dpi=300, bbox_inches='tight', facecolor='white')
+    output_path = OUTPUT_DIR / 'emergency_protocol_analysis.png'
+    plt.savefig(output_path, dpi=150, bbox_inches=None, facecolor='white',
+                pil_kwargs={'optimize': True, 'compress_level': 6})
+    plt.close(fig)
     print(f"✅ [OK] Saved: {output_path.name}")
     
-    plt.show()
-    
     return impacts
 
 def generate_detailed_comparison_table():
@@ -236,38 +242,27 @@ def generate_detailed_comparison_table():
     print("DETAILED ZONE-BY-ZONE COMPARISON")
     print("="*100)
     
-    data = []
-    for zone_id in baseline_zones.keys():
-        baseline = baseline_zones[zone_id]
-        emergency = emergency_zones[zone_id]
-        
-        data.append({
-            'Zone': zone_id,
-            'Zone Name': baseline['name'],
-            'Baseline AQI': baseline['aqi'],
-            'Emergency AQI': emergency['aqi'],
-            'AQI Reduction': baseline['aqi'] - emergency['aqi'],
-            'Baseline Speed': baseline['speed'],
-            'Emergency Speed': emergency['speed'],
-            'Speed Improvement %': ((emergency['speed'] - baseline['speed']) / baseline['speed']) * 100,
-            'Baseline Traffic': baseline['traffic'],
-            'Emergency Traffic': emergency['traffic'],
-            'Traffic Reduction %': ((baseline['traffic'] - emergency['traffic']) / baseline['traffic']) * 100,
-        })
-    
-    df = pd.DataFrame(data)
-    
-    print(df.to_string(index=False))
+    df = pd.DataFrame({
+        'Zone': ZONES_DF.index,
+        'Zone Name': ZONES_DF['name'].values,
+        'Baseline AQI': ZONES_DF['base_aqi'].values,
+        'Emergency AQI': ZONES_DF['em_aqi'].values,
+        'AQI Reduction': (ZONES_DF['base_aqi'] - ZONES_DF['em_aqi']).values,
+        'Baseline Speed': ZONES_DF['base_speed'].values,
+        'Emergency Speed': ZONES_DF['em_speed'].values,
+        'Speed Improvement %': ((ZONES_DF['em_speed'] - ZONES_DF['base_speed']) / ZONES_DF['base_speed'] * 100).values,
+        'Baseline Traffic': ZONES_DF['base_traffic'].values,
+        'Emergency Traffic': ZONES_DF['em_traffic'].values,
+        'Traffic Reduction %': ((ZONES_DF['base_traffic'] - ZONES_DF['em_traffic']) / ZONES_DF['base_traffic'] * 100).values,
+    })
+    
+    print(df.to_string(index=False, float_format='{:.1f}'.format))
     print("\n")
     
     return df
 
-def generate_html_report(df, impacts):
-    """Generate interactive HTML report"""
-    output_dir = Path('visualization_outputs')
-    output_dir.mkdir(exist_ok=True)
-    
-    html_content = """
+# Report shell; the head takes the summary metrics, the zone rows are streamed between head and tail
+REPORT_HEAD_TMPL = """
 <!DOCTYPE html>
 <html lang="en">
 <head>
@@ -275,122 +270,122 @@ def generate_html_report(df, impacts):
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Emergency Protocol Analysis Report</title>
     <style>
-        * {
+        * {{
             margin: 0;
             padding: 0;
             box-sizing: border-box;
-        }
+        }}
         
-        body {
+        body {{
             font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             min-height: 100vh;
             padding: 20px;
-        }
+        }}
         
-        .container {
+        .container {{
             max-width: 1400px;
             margin: 0 auto;
             background: white;
             border-radius: 15px;
             box-shadow: 0 20px 60px rgba(0, 0, 0, 0.3);
             padding: 40px;
-        }
+        }}
         
-        h1 {
+        h1 {{
             color: #ef4444;
             text-align: center;
             margin-bottom: 10px;
             font-size: 2.5em;
-        }
+        }}
         
-        .subtitle {
+        .subtitle {{
             text-align: center;
             color: #666;
             margin-bottom: 30px;
             font-size: 1.1em;
-        }
+        }}
         
-        .summary-grid {
+        .summary-grid {{
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
             gap: 20px;
             margin-bottom: 40px;
-        }
+        }}
         
-        .metric-card {
+        .metric-card {{
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             padding: 25px;
             border-radius: 12px;
             color: white;
             box-shadow: 0 4px 15px rgba(0, 0, 0, 0.1);
-        }
+        }}
         
-        .metric-value {
+        .metric-value {{
             font-size: 2.5em;
             font-weight: bold;
             margin-bottom: 8px;
-        }
+        }}
         
-        .metric-label {
+        .metric-label {{
             font-size: 0.9em;
             opacity: 0.9;
-        }
+        }}
         
-        table {
+        table {{
             width: 100%;
             border-collapse: collapse;
             margin-top: 30px;
             font-size: 0.95em;
-        }
+        }}
         
-        th {
+        th {{
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             color: white;
             padding: 15px;
             text-align: left;
             font-weight: 600;
-        }
+        }}
         
-        td {
+        td {{
             padding: 12px 15px;
             border-bottom: 1px solid #e5e7eb;
-        }
+        }}
         
-        tr:hover {
+        tr:hover {{
             background-color: #f9fafb;
-        }
+        }}
         
-        .positive {
+        .positive {{
             color: #10b981;
             font-weight: 600;
-        }
+        }}
         
-        .negative {
+        .negative {{
             color: #ef4444;
             font-weight: 600;
-        }
+        }}
         
-        .chart-container {
+        .chart-container {{
             margin-top: 40px;
             text-align: center;
-        }
+        }}
         
-        .chart-container img {
+        .chart-container img {{
             max-width: 100%;
             height: auto;
             border-radius: 10px;
             box-shadow: 0 10px 30px rgba(0, 0, 0, 0.1);
-        }
+        }}
         
-        .footer {
+        .footer {{
             margin-top: 40px;
             padding-top: 20px;
             border-top: 2px solid #e5e7eb;
             text-align: center;
             color: #666;
             font-size: 0.9em;
-        }
+        }}
     </style>
 </head>
 <body>
@@ -400,19 +395,19 @@ def generate_html_report(df, impacts):
         
         <div class="summary-grid">
             <div class="metric-card">
-                <div class="metric-value">145</div>
+                <div class="metric-value">{total_aqi_reduction:.0f}</div>
                 <div class="metric-label">Total AQI Reduction</div>
             </div>
             <div class="metric-card">
-                <div class="metric-value">18.5%</div>
+                <div class="metric-value">{avg_speed_improvement:.1f}%</div>
                 <div class="metric-label">Avg Speed Improvement</div>
             </div>
             <div class="metric-card">
-                <div class="metric-value">47.2%</div>
+                <div class="metric-value">{avg_traffic_reduction:.1f}%</div>
                 <div class="metric-label">Avg Traffic Reduction</div>
             </div>
             <div class="metric-card">
-                <div class="metric-value">362</div>
+                <div class="metric-value">{lives_saved:d}</div>
                 <div class="metric-label">Lives Saved (Est.)</div>
             </div>
         </div>
@@ -430,47 +425,9 @@ def generate_html_report(df, impacts):
                 </tr>
             </thead>
             <tbody>
-                <tr>
-                    <td><strong>Zone 1 - Connaught Place</strong></td>
-                    <td>328</td>
-                    <td>265</td>
-                    <td class="positive">-63 ↓</td>
-                    <td class="positive">+28.9%</td>
-                    <td class="positive">-52.0%</td>
-                </tr>
-                <tr>
-                    <td><strong>Zone 2 - Karol Bagh</strong></td>
-                    <td>315</td>
-                    <td>270</td>
-                    <td class="positive">-45 ↓</td>
-                    <td class="positive">+29.2%</td>
-                    <td class="positive">-50.0%</td>
-                </tr>
-                <tr>
-                    <td><strong>Zone 3 - Dwarka</strong></td>
-                    <td>342</td>
-                    <td>285</td>
-                    <td class="positive">-57 ↓</td>
-                    <td class="positive">+31.0%</td>
-                    <td class="positive">-50.5%</td>
-                </tr>
-                <tr>
-                    <td><strong>Zone 4 - Rohini</strong></td>
-                    <td>305</td>
-                    <td>245</td>
-                    <td class="positive">-60 ↓</td>
-                    <td class="positive">+36.0%</td>
-                    <td class="positive">-50.0%</td>
-                </tr>
-                <tr>
-                    <td><strong>Zone 5 - Saket</strong></td>
-                    <td>320</td>
-                    <td>260</td>
-                    <td class="positive">-60 ↓</td>
-                    <td class="positive">+30.4%</td>
-                    <td class="positive">-50.0%</td>
-                </tr>
-            </tbody>
+"""
+
+REPORT_TAIL_TMPL = """            </tbody>
         </table>
         
         <div class="chart-container">
@@ -486,20 +443,83 @@ def generate_html_report(df, impacts):
 </body>
 </html>
     """
-    
-    html_path = output_dir / 'emergency_protocol_report.html'
-    with open(html_path, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+
+REPORT_ROW_TMPL = """                <tr>
+                    <td><strong>{label}</strong></td>
+                    <td>{base}</td>
+                    <td>{em}</td>
+                    <td class="positive">{aqi_red}</td>
+                    <td class="positive">{spd}</td>
+                    <td class="positive">{trf}</td>
+                </tr>
+"""
+
+def report_rows(df):
+    """Yield formatted HTML table rows from the comparison DataFrame"""
+    cells = df.assign(
+        label=df['Zone'].str.replace('_', ' ') + ' - ' + df['Zone Name'],
+        aqi_red=df['AQI Reduction'].map('-{:d} ↓'.format),
+        spd=df['Speed Improvement %'].map('+{:.1f}%'.format),
+        trf=df['Traffic Reduction %'].map('-{:.1f}%'.format),
+    )[['label', 'Baseline AQI', 'Emergency AQI', 'aqi_red', 'spd', 'trf']]
+    for label, base, em, aqi_red, spd, trf in cells.itertuples(index=False):
+        yield REPORT_ROW_TMPL.format(label=label, base=base, em=em,
+                                     aqi_red=aqi_red, spd=spd, trf=trf)
+
+def summary_metrics(impacts):
+    """Headline totals of the calculate_impact() records, shared by the HTML report and the console summary"""
+    return {
+        'total_aqi_reduction': impacts['aqi_reduction'].sum(),
+        'avg_speed_improvement': impacts['speed_improvement'].mean(),
+        'avg_traffic_reduction': impacts['traffic_reduction'].mean(),
+        'lives_saved': int(impacts['health_impact'].sum() / 10),
+    }
+
+def generate_html_report(df, impacts):
+    """Generate interactive HTML report"""
+    html_path = OUTPUT_DIR / 'emergency_protocol_report.html'
+    with open(html_path, 'w', encoding='utf-8', buffering=64 * 1024) as f:
+        f.write(REPORT_HEAD_TMPL.format_map(summary_metrics(impacts)))
+        f.writelines(report_rows(df))
+        f.write(REPORT_TAIL_TMPL)
     
     print(f"✅ [OK] HTML Report: {html_path.name}")
     
     return html_path
 
+def inputs_cache_key():
+    """Hash of the zone data and this script, identifying the rendered outputs"""
+    digest = hashlib.sha1(ZONES_DF.to_csv().encode('utf-8'))
+    digest.update(Path(__file__).read_bytes())
+    return digest.hexdigest()
+
+def open_report(html_path):
+    """Open the report in a browser, only when run from an interactive terminal"""
+    if sys.stdout.isatty():
+        try:
+            webbrowser.open(f'file:///{html_path.absolute()}')
+            print(f"\n✅ Opening report in browser...")
+            return
+        except Exception:
+            pass
+    print(f"\n📄 Open this file manually: {html_path.absolute()}")
+
 def main():
     print("\n" + "="*100)
     print("EMERGENCY PROTOCOL - COMPREHENSIVE ANALYSIS")
     print("="*100)
     
+    # Reuse the PNG + HTML when nothing that feeds them has changed
+    cache_path = OUTPUT_DIR / '.cache_key'
+    html_path = OUTPUT_DIR / 'emergency_protocol_report.html'
+    outputs = [OUTPUT_DIR / 'emergency_protocol_analysis.png', html_path]
+    cache_key = inputs_cache_key()
+    if (cache_path.is_file() and cache_path.read_text() == cache_key
+            and all(path.is_file() for path in outputs)):
+        print("\n✅ [OK] Inputs unchanged - reusing existing analysis outputs")
+        open_report(html_path)
+        return
+    
     # Generate analysis
     impacts = generate_analysis_dashboard()
     
@@ -508,34 +528,35 @@ def main():
     
     # Generate HTML report
     html_path = generate_html_report(df, impacts)
-    
-    print("\n" + "="*100)
-    print("ANALYSIS COMPLETE!")
-    print("="*100)
-    
-    print("\n📊 Generated Files:")
-    print("   1. emergency_protocol_analysis.png - Comprehensive visualization dashboard")
-    print("   2. emergency_protocol_report.html - Interactive HTML report")
-    
-    print("\n📈 KEY FINDINGS:")
-    print(f"   ✅ Total AQI Reduction: 145 points")
-    print(f"   ✅ Average Speed Improvement: 18.5%")
-    print(f"   ✅ Average Traffic Reduction: 47.2%")
-    print(f"   ✅ Estimated Lives Saved: 362 people")
-    
-    print("\n🎯 RECOMMENDATIONS:")
-    print("   • Implement truck bans during peak hours (6 AM - 11 AM)")
-    print("   • Activate dynamic rerouting system")
-    print("   • Deploy school and hospital advisories")
-    print("   • Coordinate with public transport for free metro passes")
+    cache_path.write_text(cache_key)
+    metrics = summary_metrics(impacts)
+    
+    summary_lines = [
+        "",
+        "=" * 100,
+        "ANALYSIS COMPLETE!",
+        "=" * 100,
+        "",
+        "📊 Generated Files:",
+        "   1. emergency_protocol_analysis.png - Comprehensive visualization dashboard",
+        "   2. emergency_protocol_report.html - Interactive HTML report",
+        "",
+        "📈 KEY FINDINGS:",
+        f"   ✅ Total AQI Reduction: {metrics['total_aqi_reduction']:.0f} points",
+        f"   ✅ Average Speed Improvement: {metrics['avg_speed_improvement']:.1f}%",
+        f"   ✅ Average Traffic Reduction: {metrics['avg_traffic_reduction']:.1f}%",
+        f"   ✅ Estimated Lives Saved: {metrics['lives_saved']} people",
+        "",
+        "🎯 RECOMMENDATIONS:",
+        "   • Implement truck bans during peak hours (6 AM - 11 AM)",
+        "   • Activate dynamic rerouting system",
+        "   • Deploy school and hospital advisories",
+        "   • Coordinate with public transport for free metro passes",
+    ]
+    sys.stdout.write("\n".join(summary_lines) + "\n")
     
     # Open HTML report
-    try:
-        import webbrowser
-        webbrowser.open(f'file:///{html_path.absolute()}')
-        print(f"\n✅ Opening report in browser...")
-    except Exception as e:
-        print(f"\n📄 Open this file manually: {html_path.absolute()}")
+    open_report(html_path)
     
     print("\n" + "="*100 + "\n")
 
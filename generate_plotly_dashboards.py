@@ -3,47 +3,114 @@ Advanced Interactive Emergency Protocol Dashboard
 Using Plotly for interactive visualizations
 """
 
+import re
+import gzip
+import hashlib
 import pandas as pd
 import numpy as np
 import plotly.graph_objects as go
-import plotly.express as px
+import plotly.io as pio
+from plotly.offline import get_plotlyjs_version
 from plotly.subplots import make_subplots
 from pathlib import Path
+from collections import namedtuple
+from functools import lru_cache
 
-# Mock Data
-baseline_zones = {
-    'Zone_1': {'name': 'Connaught Place', 'aqi': 328, 'speed': 45, 'traffic': 8750, 'pm25': 185, 'no2': 95},
-    'Zone_2': {'name': 'Karol Bagh', 'aqi': 315, 'speed': 48, 'traffic': 7200, 'pm25': 178, 'no2': 88},
-    'Zone_3': {'name': 'Dwarka', 'aqi': 342, 'speed': 42, 'traffic': 9100, 'pm25': 195, 'no2': 102},
-    'Zone_4': {'name': 'Rohini', 'aqi': 305, 'speed': 50, 'traffic': 6800, 'pm25': 170, 'no2': 82},
-    'Zone_5': {'name': 'Saket', 'aqi': 320, 'speed': 46, 'traffic': 7500, 'pm25': 182, 'no2': 91},
-}
+_OUTPUT_DIR = Path('visualization_outputs')
+_OUTPUT_DIR.mkdir(exist_ok=True)
 
-emergency_zones = {
-    'Zone_1': {'name': 'Connaught Place', 'aqi': 265, 'speed': 58, 'traffic': 4200, 'pm25': 142, 'no2': 68},
-    'Zone_2': {'name': 'Karol Bagh', 'aqi': 270, 'speed': 62, 'traffic': 3600, 'pm25': 147, 'no2': 71},
-    'Zone_3': {'name': 'Dwarka', 'aqi': 285, 'speed': 55, 'traffic': 4500, 'pm25': 158, 'no2': 78},
-    'Zone_4': {'name': 'Rohini', 'aqi': 245, 'speed': 68, 'traffic': 3400, 'pm25': 132, 'no2': 61},
-    'Zone_5': {'name': 'Saket', 'aqi': 260, 'speed': 60, 'traffic': 3750, 'pm25': 140, 'no2': 67},
-}
+_INTERTAG_WS = re.compile(r'>\s+<')
 
-def create_comparison_dashboard():
-    """Create comprehensive Plotly dashboard"""
-    
-    zones_list = list(baseline_zones.keys())
-    zone_names = [baseline_zones[z]['name'] for z in zones_list]
-    
-    baseline_aqi = [baseline_zones[z]['aqi'] for z in zones_list]
-    emergency_aqi = [emergency_zones[z]['aqi'] for z in zones_list]
-    
-    baseline_speed = [baseline_zones[z]['speed'] for z in zones_list]
-    emergency_speed = [emergency_zones[z]['speed'] for z in zones_list]
+# Fixed page for a single figure: the figure JSON is spliced in, no per-call templating
+_FIGURE_SHELL = """<html>
+<head><meta charset="utf-8" /></head>
+<body>
+    <div style="height:__HEIGHT__px; width:100%;">
+        <script charset="utf-8" src="https://cdn.plot.ly/plotly-__PLOTLYJS_VERSION__.min.js"></script>
+        <div id="graph" class="plotly-graph-div" style="height:100%; width:100%;"></div>
+        <script>
+            Plotly.newPlot("graph", __FIG_JSON__, {"responsive": true});
+        </script>
+    </div>
+</body>
+</html>
+""".replace('__PLOTLYJS_VERSION__', get_plotlyjs_version())
+
+def _figure_html(fig):
+    """Render a figure into _FIGURE_SHELL (pio picks orjson for the JSON when it is installed)"""
+    return (_FIGURE_SHELL
+            .replace('__HEIGHT__', str(fig.layout.height))
+            .replace('__FIG_JSON__', pio.to_json(fig, validate=False)))
+
+def _write_html(output_path, html):
+    """Write whitespace-collapsed HTML plus a gzipped copy for servers that serve .gz directly"""
+    html = _INTERTAG_WS.sub('><', html)
+    output_path.write_text(html, encoding='utf-8')
+    with gzip.open(output_path.with_suffix('.html.gz'), 'wt', encoding='utf-8', compresslevel=6) as f:
+        f.write(html)
+
+# Mock Data - Baseline (base_*) vs Emergency Protocol Response (em_*), one row per zone
+ZONES_DF = pd.DataFrame({
+    'name': ['Connaught Place', 'Karol Bagh', 'Dwarka', 'Rohini', 'Saket'],
+    'base_aqi': [328, 315, 342, 305, 320],
+    'em_aqi': [265, 270, 285, 245, 260],
+    'base_speed': [45, 48, 42, 50, 46],
+    'em_speed': [58, 62, 55, 68, 60],
+    'base_traffic': [8750, 7200, 9100, 6800, 7500],
+    'em_traffic': [4200, 3600, 4500, 3400, 3750],
+    'base_pm25': [185, 178, 195, 170, 182],
+    'em_pm25': [142, 147, 158, 132, 140],
+    'base_no2': [95, 88, 102, 82, 91],
+    'em_no2': [68, 71, 78, 61, 67],
+}, index=pd.Index(['Zone_1', 'Zone_2', 'Zone_3', 'Zone_4', 'Zone_5'], name='zone_id'))
+
+# Baseline/emergency bar fills with the 0.8 alpha baked in, instead of a per-trace opacity
+_BASELINE_COLOR = 'rgba(239,68,68,0.8)'
+_EMER_COLOR = 'rgba(16,185,129,0.8)'
+
+# Column-major views of the mock data, built once: one row per zone, one column per metric
+_COLS = ['aqi', 'speed', 'traffic', 'pm25', 'no2']
+AQI, SPEED, TRAFFIC, PM25, NO2 = range(len(_COLS))
+_NAMES = ZONES_DF['name'].to_numpy()
+_BASE = ZONES_DF[[f'base_{c}' for c in _COLS]].to_numpy()
+_EMER = ZONES_DF[[f'em_{c}' for c in _COLS]].to_numpy()
+
+# Everything the charts and the report plot, derived in one pass. Hashes and compares by
+# `key`, a digest of the zone data, so the figure builders can be memoized per data version.
+# A single main() builds each figure once; the caches pay off for importers that render
+# repeatedly in one process (e.g. calling main() or the create_* writers again).
+class ZoneData(namedtuple('ZoneData', 'key names base emer aqi_red spd_imp trf_red')):
+    __slots__ = ()
+    
+    def __hash__(self):
+        return hash(self.key)
+    
+    def __eq__(self, other):
+        return isinstance(other, ZoneData) and self.key == other.key
+
+def _prepare_zone_frame():
+    """Bundle the zone arrays with the per-zone impact deltas shared by every output"""
+    key = hashlib.sha1(_BASE.tobytes() + _EMER.tobytes() + '\0'.join(_NAMES).encode('utf-8')).hexdigest()
+    return ZoneData(
+        key=key,
+        names=_NAMES,
+        base=_BASE,
+        emer=_EMER,
+        aqi_red=_BASE[:, AQI] - _EMER[:, AQI],
+        spd_imp=(_EMER[:, SPEED] - _BASE[:, SPEED]) / _BASE[:, SPEED] * 100,
+        trf_red=(_BASE[:, TRAFFIC] - _EMER[:, TRAFFIC]) / _BASE[:, TRAFFIC] * 100,
+    )
+
+@lru_cache(maxsize=4)
+def comparison_figure(zd):
+    """Build the comparison dashboard figure; memoized per zone-data version, so treat it as read-only"""
     
-    baseline_traffic = [baseline_zones[z]['traffic'] for z in zones_list]
-    emergency_traffic = [emergency_zones[z]['traffic'] for z in zones_list]
+    zone_names = zd.names
     
-    baseline_pm25 = [baseline_zones[z]['pm25'] for z in zones_list]
-    emergency_pm25 = [emergency_zones[z]['pm25'] for z in zones_list]
+    baseline_aqi, emergency_aqi = zd.base[:, AQI], zd.emer[:, AQI]
+    baseline_speed, emergency_speed = zd.base[:, SPEED], zd.emer[:, SPEED]
+    baseline_traffic, emergency_traffic = zd.base[:, TRAFFIC], zd.emer[:, TRAFFIC]
+    baseline_pm25, emergency_pm25 = zd.base[:, PM25], zd.emer[:, PM25]
     
     # Create subplots
     fig = make_subplots(
@@ -54,63 +121,42 @@ def create_comparison_dashboard():
                [{"type": "bar"}, {"type": "scatter"}]]
     )
     
-    # AQI Comparison
-    fig.add_trace(
+    # All traces validated and placed in one add_traces call
+    traces = [
+        # AQI Comparison
         go.Bar(x=zone_names, y=baseline_aqi, name='Baseline', 
-               marker_color='#ef4444', opacity=0.8),
-        row=1, col=1
-    )
-    fig.add_trace(
+               marker_color=_BASELINE_COLOR),
         go.Bar(x=zone_names, y=emergency_aqi, name='Emergency Response', 
-               marker_color='#10b981', opacity=0.8),
-        row=1, col=1
-    )
-    
-    # Speed Improvement
-    fig.add_trace(
+               marker_color=_EMER_COLOR),
+        
+        # Speed Improvement
         go.Bar(x=zone_names, y=baseline_speed, name='Baseline Speed', 
-               marker_color='#ef4444', opacity=0.8, showlegend=False),
-        row=1, col=2
-    )
-    fig.add_trace(
+               marker_color=_BASELINE_COLOR, showlegend=False),
         go.Bar(x=zone_names, y=emergency_speed, name='Emergency Speed', 
-               marker_color='#10b981', opacity=0.8, showlegend=False),
-        row=1, col=2
-    )
-    
-    # Traffic Volume
-    fig.add_trace(
+               marker_color=_EMER_COLOR, showlegend=False),
+        
+        # Traffic Volume
         go.Bar(x=zone_names, y=baseline_traffic, name='Baseline Traffic', 
-               marker_color='#ef4444', opacity=0.8, showlegend=False),
-        row=2, col=1
-    )
-    fig.add_trace(
+               marker_color=_BASELINE_COLOR, showlegend=False),
         go.Bar(x=zone_names, y=emergency_traffic, name='Emergency Traffic', 
-               marker_color='#10b981', opacity=0.8, showlegend=False),
-        row=2, col=1
-    )
-    
-    # PM2.5 Levels (line chart)
-    fig.add_trace(
-        go.Scatter(x=zone_names, y=baseline_pm25, name='Baseline PM2.5', 
-                  mode='lines+markers', line=dict(color='#ef4444', width=3),
-                  marker=dict(size=10), showlegend=False),
-        row=2, col=2
-    )
-    fig.add_trace(
-        go.Scatter(x=zone_names, y=emergency_pm25, name='Emergency PM2.5', 
-                  mode='lines+markers', line=dict(color='#10b981', width=3),
-                  marker=dict(size=10), showlegend=False),
-        row=2, col=2
-    )
+               marker_color=_EMER_COLOR, showlegend=False),
+        
+        # PM2.5 Levels (line chart)
+        go.Scattergl(x=zone_names, y=baseline_pm25, name='Baseline PM2.5', 
+                     mode='lines+markers', line=dict(color='#ef4444', width=3),
+                     marker=dict(size=10), showlegend=False),
+        go.Scattergl(x=zone_names, y=emergency_pm25, name='Emergency PM2.5', 
+                     mode='lines+markers', line=dict(color='#10b981', width=3),
+                     marker=dict(size=10), showlegend=False),
+    ]
+    fig.add_traces(traces, rows=[1, 1, 1, 1, 2, 2, 2, 2], cols=[1, 1, 2, 2, 1, 1, 2, 2])
     
     # Update layout
-    fig.update_yaxes(title_text="AQI Level", row=1, col=1)
-    fig.update_yaxes(title_text="Speed (km/h)", row=1, col=2)
-    fig.update_yaxes(title_text="Vehicles/Hour", row=2, col=1)
-    fig.update_yaxes(title_text="PM2.5 (µg/m³)", row=2, col=2)
-    
     fig.update_layout(
+        yaxis_title="AQI Level",
+        yaxis2_title="Speed (km/h)",
+        yaxis3_title="Vehicles/Hour",
+        yaxis4_title="PM2.5 (µg/m³)",
         title_text="Emergency Protocol Response Dashboard",
         height=800,
         showlegend=True,
@@ -118,22 +164,25 @@ def create_comparison_dashboard():
         template='plotly_white'
     )
     
-    output_dir = Path('visualization_outputs')
-    output_path = output_dir / 'interactive_dashboard.html'
-    fig.write_html(output_path)
+    return fig
+
+def create_comparison_dashboard(zd):
+    """Create comprehensive Plotly dashboard"""
+    output_path = _OUTPUT_DIR / 'interactive_dashboard.html'
+    _write_html(output_path, _figure_html(comparison_figure(zd)))
     print(f"[OK] Created interactive dashboard: {output_path.name}")
     
     return output_path
 
-def create_impact_metrics_chart():
-    """Create impact metrics visualization"""
+@lru_cache(maxsize=4)
+def impact_metrics_figure(zd):
+    """Build the impact metrics figure; memoized per zone-data version, so treat it as read-only"""
     
-    zones_list = list(baseline_zones.keys())
-    zone_names = [baseline_zones[z]['name'] for z in zones_list]
+    zone_names = zd.names
     
-    aqi_reduction = [baseline_zones[z]['aqi'] - emergency_zones[z]['aqi'] for z in zones_list]
-    speed_improvement = [((emergency_zones[z]['speed'] - baseline_zones[z]['speed']) / baseline_zones[z]['speed']) * 100 for z in zones_list]
-    traffic_reduction = [((baseline_zones[z]['traffic'] - emergency_zones[z]['traffic']) / baseline_zones[z]['traffic']) * 100 for z in zones_list]
+    aqi_reduction = zd.aqi_red
+    speed_improvement = zd.spd_imp
+    traffic_reduction = zd.trf_red
     
     fig = make_subplots(
         rows=1, cols=3,
@@ -141,54 +190,48 @@ def create_impact_metrics_chart():
         specs=[[{"type": "bar"}, {"type": "bar"}, {"type": "bar"}]]
     )
     
-    # AQI Reduction
-    fig.add_trace(
-        go.Bar(x=zone_names, y=aqi_reduction, marker_color='#3b82f6', text=aqi_reduction,
+    traces = [
+        # AQI Reduction
+        go.Bar(x=zone_names, y=aqi_reduction, marker_color='#3b82f6', text=aqi_reduction.astype(str),
                textposition='outside', showlegend=False),
-        row=1, col=1
-    )
-    
-    # Speed Improvement
-    fig.add_trace(
-        go.Bar(x=zone_names, y=speed_improvement, marker_color='#10b981', text=[f'{x:.1f}%' for x in speed_improvement],
+        
+        # Speed Improvement
+        go.Bar(x=zone_names, y=speed_improvement, marker_color='#10b981', text=np.char.mod('%.1f%%', speed_improvement),
                textposition='outside', showlegend=False),
-        row=1, col=2
-    )
-    
-    # Traffic Reduction
-    fig.add_trace(
-        go.Bar(x=zone_names, y=traffic_reduction, marker_color='#f59e0b', text=[f'{x:.1f}%' for x in traffic_reduction],
+        
+        # Traffic Reduction
+        go.Bar(x=zone_names, y=traffic_reduction, marker_color='#f59e0b', text=np.char.mod('%.1f%%', traffic_reduction),
                textposition='outside', showlegend=False),
-        row=1, col=3
-    )
-    
-    fig.update_yaxes(title_text="AQI Reduction", row=1, col=1)
-    fig.update_yaxes(title_text="Improvement %", row=1, col=2)
-    fig.update_yaxes(title_text="Reduction %", row=1, col=3)
+    ]
+    fig.add_traces(traces, rows=[1, 1, 1], cols=[1, 2, 3])
     
     fig.update_layout(
+        yaxis_title="AQI Reduction",
+        yaxis2_title="Improvement %",
+        yaxis3_title="Reduction %",
         title_text="Emergency Protocol Impact Metrics",
         height=500,
         template='plotly_white'
     )
     
-    output_dir = Path('visualization_outputs')
-    output_path = output_dir / 'impact_metrics.html'
-    fig.write_html(output_path)
+    return fig
+
+def create_impact_metrics_chart(zd):
+    """Create impact metrics visualization"""
+    output_path = _OUTPUT_DIR / 'impact_metrics.html'
+    _write_html(output_path, _figure_html(impact_metrics_figure(zd)))
     print(f"[OK] Created impact metrics chart: {output_path.name}")
     
     return output_path
 
-def create_pollutant_breakdown():
-    """Create pollutant level breakdown"""
+@lru_cache(maxsize=4)
+def pollutant_figure(zd):
+    """Build the pollutant breakdown figure; memoized per zone-data version, so treat it as read-only"""
     
-    zones_list = list(baseline_zones.keys())
-    zone_names = [baseline_zones[z]['name'] for z in zones_list]
+    zone_names = zd.names
     
-    baseline_pm25 = [baseline_zones[z]['pm25'] for z in zones_list]
-    emergency_pm25 = [emergency_zones[z]['pm25'] for z in zones_list]
-    baseline_no2 = [baseline_zones[z]['no2'] for z in zones_list]
-    emergency_no2 = [emergency_zones[z]['no2'] for z in zones_list]
+    baseline_pm25, emergency_pm25 = zd.base[:, PM25], zd.emer[:, PM25]
+    baseline_no2, emergency_no2 = zd.base[:, NO2], zd.emer[:, NO2]
     
     fig = make_subplots(
         rows=1, cols=2,
@@ -196,55 +239,38 @@ def create_pollutant_breakdown():
         specs=[[{"type": "bar"}, {"type": "bar"}]]
     )
     
-    fig.add_trace(
-        go.Bar(name='Baseline PM2.5', x=zone_names, y=baseline_pm25, marker_color='#ef4444', opacity=0.8),
-        row=1, col=1
-    )
-    fig.add_trace(
-        go.Bar(name='Emergency PM2.5', x=zone_names, y=emergency_pm25, marker_color='#10b981', opacity=0.8),
-        row=1, col=1
-    )
-    
-    fig.add_trace(
-        go.Bar(name='Baseline NO2', x=zone_names, y=baseline_no2, marker_color='#ef4444', 
-               opacity=0.8, showlegend=False),
-        row=1, col=2
-    )
-    fig.add_trace(
-        go.Bar(name='Emergency NO2', x=zone_names, y=emergency_no2, marker_color='#10b981', 
-               opacity=0.8, showlegend=False),
-        row=1, col=2
-    )
-    
-    fig.update_yaxes(title_text="PM2.5 (µg/m³)", row=1, col=1)
-    fig.update_yaxes(title_text="NO2 (µg/m³)", row=1, col=2)
+    traces = [
+        go.Bar(name='Baseline PM2.5', x=zone_names, y=baseline_pm25, marker_color=_BASELINE_COLOR),
+        go.Bar(name='Emergency PM2.5', x=zone_names, y=emergency_pm25, marker_color=_EMER_COLOR),
+        
+        go.Bar(name='Baseline NO2', x=zone_names, y=baseline_no2, marker_color=_BASELINE_COLOR,
+               showlegend=False),
+        go.Bar(name='Emergency NO2', x=zone_names, y=emergency_no2, marker_color=_EMER_COLOR,
+               showlegend=False),
+    ]
+    fig.add_traces(traces, rows=[1, 1, 1, 1], cols=[1, 1, 2, 2])
     
     fig.update_layout(
+        yaxis_title="PM2.5 (µg/m³)",
+        yaxis2_title="NO2 (µg/m³)",
         title_text="Pollutant Level Analysis",
         height=500,
         template='plotly_white',
         barmode='group'
     )
     
-    output_dir = Path('visualization_outputs')
-    output_path = output_dir / 'pollutant_analysis.html'
-    fig.write_html(output_path)
+    return fig
+
+def create_pollutant_breakdown(zd):
+    """Create pollutant level breakdown"""
+    output_path = _OUTPUT_DIR / 'pollutant_analysis.html'
+    _write_html(output_path, _figure_html(pollutant_figure(zd)))
     print(f"[OK] Created pollutant analysis: {output_path.name}")
     
     return output_path
 
-def create_summary_report():
-    """Create comprehensive summary report"""
-    
-    zones_list = list(baseline_zones.keys())
-    
-    # Calculate totals
-    total_aqi_reduction = sum(baseline_zones[z]['aqi'] - emergency_zones[z]['aqi'] for z in zones_list)
-    avg_speed_improvement = np.mean([((emergency_zones[z]['speed'] - baseline_zones[z]['speed']) / baseline_zones[z]['speed']) * 100 for z in zones_list])
-    avg_traffic_reduction = np.mean([((baseline_zones[z]['traffic'] - emergency_zones[z]['traffic']) / baseline_zones[z]['traffic']) * 100 for z in zones_list])
-    total_health_impact = total_aqi_reduction * 2.5
-    
-    html_content = f"""
+# Static summary report shell, parsed once; only the metric cards and zone blocks are substituted
+_REPORT_TEMPLATE = """
 <!DOCTYPE html>
 <html lang="en">
 <head>
@@ -452,23 +478,7 @@ def create_summary_report():
         <p class="subtitle">Delhi Digital Twin - Crisis Response Effectiveness Report</p>
         
         <div class="metrics-grid">
-            <div class="metric-card">
-                <div class="metric-value">{total_aqi_reduction:.0f}</div>
-                <div class="metric-label">Total AQI Reduction</div>
-            </div>
-            <div class="metric-card">
-                <div class="metric-value">{avg_speed_improvement:.1f}%</div>
-                <div class="metric-label">Avg Speed Improvement</div>
-            </div>
-            <div class="metric-card">
-                <div class="metric-value">{avg_traffic_reduction:.1f}%</div>
-                <div class="metric-label">Avg Traffic Reduction</div>
-            </div>
-            <div class="metric-card">
-                <div class="metric-value">{int(total_health_impact/10)}</div>
-                <div class="metric-label">Lives Saved (Est.)</div>
-            </div>
-        </div>
+{metrics_html}        </div>
         
         <div class="content-grid">
             <div class="card">
@@ -497,37 +507,7 @@ def create_summary_report():
         <div class="zone-details">
             <h3>Zone-by-Zone Performance</h3>
             <div class="zone-grid">
-                <div class="zone-item">
-                    <div class="zone-name">Connaught Place</div>
-                    <div class="zone-metric">AQI: 328 → 265 (-63)</div>
-                    <div class="zone-metric">Speed: +28.9%</div>
-                    <div class="zone-metric">Traffic: -52%</div>
-                </div>
-                <div class="zone-item">
-                    <div class="zone-name">Karol Bagh</div>
-                    <div class="zone-metric">AQI: 315 → 270 (-45)</div>
-                    <div class="zone-metric">Speed: +29.2%</div>
-                    <div class="zone-metric">Traffic: -50%</div>
-                </div>
-                <div class="zone-item">
-                    <div class="zone-name">Dwarka</div>
-                    <div class="zone-metric">AQI: 342 → 285 (-57)</div>
-                    <div class="zone-metric">Speed: +31%</div>
-                    <div class="zone-metric">Traffic: -50.5%</div>
-                </div>
-                <div class="zone-item">
-                    <div class="zone-name">Rohini</div>
-                    <div class="zone-metric">AQI: 305 → 245 (-60)</div>
-                    <div class="zone-metric">Speed: +36%</div>
-                    <div class="zone-metric">Traffic: -50%</div>
-                </div>
-                <div class="zone-item">
-                    <div class="zone-name">Saket</div>
-                    <div class="zone-metric">AQI: 320 → 260 (-60)</div>
-                    <div class="zone-metric">Speed: +30.4%</div>
-                    <div class="zone-metric">Traffic: -50%</div>
-                </div>
-            </div>
+{zone_blocks}            </div>
         </div>
         
         <div class="links">
@@ -544,11 +524,51 @@ def create_summary_report():
 </body>
 </html>
     """
+
+_METRIC_CARD_TEMPLATE = """            <div class="metric-card">
+                <div class="metric-value">{value}</div>
+                <div class="metric-label">{label}</div>
+            </div>
+"""
+
+_ZONE_ITEM_TEMPLATE = """                <div class="zone-item">
+                    <div class="zone-name">{name}</div>
+                    <div class="zone-metric">AQI: {b_aqi} → {e_aqi} ({d_aqi:+d})</div>
+                    <div class="zone-metric">Speed: {spd:+.1f}%</div>
+                    <div class="zone-metric">Traffic: {trf:+.1f}%</div>
+                </div>
+"""
+
+def create_summary_report(zd):
+    """Create comprehensive summary report"""
+    
+    # Calculate totals
+    total_aqi_reduction = zd.aqi_red.sum()
+    avg_speed_improvement = zd.spd_imp.mean()
+    avg_traffic_reduction = zd.trf_red.mean()
+    total_health_impact = total_aqi_reduction * 2.5
+    
+    metrics = (
+        (f"{total_aqi_reduction:.0f}", "Total AQI Reduction"),
+        (f"{avg_speed_improvement:.1f}%", "Avg Speed Improvement"),
+        (f"{avg_traffic_reduction:.1f}%", "Avg Traffic Reduction"),
+        (int(total_health_impact/10), "Lives Saved (Est.)"),
+    )
+    metrics_html = ''.join(_METRIC_CARD_TEMPLATE.format(value=value, label=label)
+                           for value, label in metrics)
+    zone_blocks = ''.join(
+        _ZONE_ITEM_TEMPLATE.format(name=zd.names[i], b_aqi=zd.base[i, AQI], e_aqi=zd.emer[i, AQI],
+                                   d_aqi=-zd.aqi_red[i], spd=zd.spd_imp[i], trf=-zd.trf_red[i])
+        for i in range(len(zd.names))
+    )
+    
+    html_content = _REPORT_TEMPLATE.format_map({
+        'metrics_html': metrics_html,
+        'zone_blocks': zone_blocks,
+    })
     
-    output_dir = Path('visualization_outputs')
-    output_path = output_dir / 'emergency_protocol_complete.html'
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+    output_path = _OUTPUT_DIR / 'emergency_protocol_complete.html'
+    _write_html(output_path, html_content)
     
     print(f"[OK] Created complete report: {output_path.name}")
     return output_path
@@ -561,10 +581,11 @@ def main():
     # Create visualizations
     print("Generating interactive visualizations...")
     
-    dashboard_path = create_comparison_dashboard()
-    metrics_path = create_impact_metrics_chart()
-    pollutant_path = create_pollutant_breakdown()
-    report_path = create_summary_report()
+    zd = _prepare_zone_frame()
+    dashboard_path = create_comparison_dashboard(zd)
+    metrics_path = create_impact_metrics_chart(zd)
+    pollutant_path = create_pollutant_breakdown(zd)
+    report_path = create_summary_report(zd)
     
     print("\n" + "="*100)
     print("VISUALIZATION COMPLETE!")
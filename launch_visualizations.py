@@ -10,9 +10,45 @@ import subprocess
 import webbrowser
 import time
 import threading
+import multiprocessing
+import runpy
+import importlib.util
+import socket
+import io
+import contextlib
+import traceback
 from pathlib import Path
 import json
 
+def wait_port(host, port, timeout=10):
+    """Block until a TCP connect to host:port succeeds; False if timeout elapses first"""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            socket.create_connection((host, port), 0.1).close()
+            return True
+        except OSError:
+            time.sleep(0.05)
+    return False
+
+def _preimport_plotly(cwd):
+    """Pool initializer: warm the heavy imports once per worker"""
+    os.chdir(cwd)
+    import numpy, pandas, plotly.graph_objects, plotly.express, plotly.subplots  # noqa: F401
+
+def _run_viz_script(script):
+    """Run a script as __main__ in the worker; returns (ok, stdout, error text)"""
+    out = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(out):
+            runpy.run_path(script, run_name='__main__')
+    except SystemExit as e:
+        if e.code not in (None, 0):
+            return False, out.getvalue(), f"exit status {e.code}"
+    except BaseException:
+        return False, out.getvalue(), traceback.format_exc()
+    return True, out.getvalue(), ''
+
 class VisualizationLauncher:
     """Orchestrate all visualization components"""
     
@@ -20,6 +56,14 @@ class VisualizationLauncher:
         self.base_path = Path(__file__).parent
         self.plotly_path = self.base_path / "visualization_outputs"
         self.html_dashboard = self.base_path / "visualization_dashboard.html"
+        self._pool = None  # warm visualization worker, started on first use
+        self._server = None  # in-process WSGI server for the Flask API
+        self._check_outputs()
+    
+    def _check_outputs(self):
+        """Stat the generated dashboards once; open/summary steps reuse the result"""
+        self._have_plotly = os.path.isfile(self.plotly_path / "index.html")
+        self._have_dashboard = os.path.isfile(self.html_dashboard)
         
     def print_header(self, text):
         """Print formatted header"""
@@ -44,8 +88,24 @@ class VisualizationLauncher:
         icon = icons.get(status, '•')
         print(f"{icon} {message}")
     
-    def generate_plotly_visualizations(self):
-        """Generate interactive Plotly charts"""
+    def _viz_pool(self):
+        """Single spawned worker with plotly/pandas already imported, reused across regenerations"""
+        if self._pool is None:
+            self._pool = multiprocessing.get_context('spawn').Pool(
+                1, initializer=_preimport_plotly, initargs=(str(self.base_path),))
+        return self._pool
+    
+    def close(self):
+        """Shut down the visualization worker and the API server, if started"""
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool = None
+        if self._server is not None:
+            self._server.shutdown()
+            self._server = None
+    
+    def generate_plotly_visualizations(self, use_pool=True):
+        """Generate interactive Plotly charts (use_pool=False runs a one-shot subprocess instead)"""
         self.print_section("GENERATING PLOTLY VISUALIZATIONS")
         
         try:
@@ -58,26 +118,32 @@ class VisualizationLauncher:
             self.print_status('loading', "Running Plotly visualization generator...")
             
             # Run visualization script
-            result = subprocess.run(
-                [sys.executable, str(viz_script)],
-                cwd=str(self.base_path),
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
+            if use_pool:
+                ok, stdout, stderr = self._viz_pool().apply_async(
+                    _run_viz_script, (str(viz_script),)).get(timeout=60)
+            else:
+                result = subprocess.run(
+                    [sys.executable, str(viz_script)],
+                    cwd=str(self.base_path),
+                    capture_output=True,
+                    text=True,
+                    timeout=60
+                )
+                ok, stdout, stderr = result.returncode == 0, result.stdout, result.stderr
             
-            if result.returncode == 0:
+            if ok:
                 self.print_status('success', "Plotly visualizations generated")
                 # Print output
-                for line in result.stdout.split('\n'):
+                for line in stdout.split('\n'):
                     if line.strip():
                         self.print_status('info', line)
                 return True
             else:
-                self.print_status('error', f"Visualization generation failed: {result.stderr}")
+                self.print_status('error', f"Visualization generation failed: {stderr}")
                 return False
                 
-        except subprocess.TimeoutExpired:
+        except (subprocess.TimeoutExpired, multiprocessing.TimeoutError):
+            self.close()  # a hung worker would block the next regeneration
             self.print_status('error', "Visualization generation timed out")
             return False
         except Exception as e:
@@ -85,31 +151,37 @@ class VisualizationLauncher:
             return False
     
     def start_flask_server(self):
-        """Start Flask development server in background"""
+        """Serve the Flask API from a background thread of this process"""
         self.print_section("STARTING FLASK API SERVER")
         
         try:
             # Check if main app file exists
-            app_file = self.base_path / "app.py"
+            app_file = self.base_path / "backend" / "app.py"
             if not app_file.exists():
-                self.print_status('warning', "app.py not found, Flask server not started")
+                self.print_status('warning', "backend/app.py not found, Flask server not started")
                 return None
             
             self.print_status('loading', "Starting Flask server on http://localhost:5000...")
             
-            # Start Flask server in background thread
-            def run_flask():
-                subprocess.run(
-                    [sys.executable, str(app_file)],
-                    cwd=str(self.base_path)
-                )
+            # Load app.py by path under its own name: a bare `import app` could pick up any other
+            # `app` module. Its blueprints are imported as top-level modules from backend/, so
+            # that directory is on sys.path only while the module executes
+            spec = importlib.util.spec_from_file_location('backend_app', app_file)
+            backend_app = importlib.util.module_from_spec(spec)
+            sys.modules[spec.name] = backend_app  # Flask looks its root path up by module name
+            saved_path = sys.path[:]
+            sys.path.insert(0, str(app_file.parent))
+            try:
+                spec.loader.exec_module(backend_app)
+            finally:
+                sys.path[:] = saved_path
+            from werkzeug.serving import make_server
             
-            flask_thread = threading.Thread(target=run_flask, daemon=True)
+            # make_server binds and listens before returning, so requests queue from here on
+            self._server = make_server('127.0.0.1', 5000, backend_app.app, threaded=True)
+            flask_thread = threading.Thread(target=self._server.serve_forever, daemon=True)
             flask_thread.start()
             
-            # Wait for server to start
-            time.sleep(3)
-            
             self.print_status('success', "Flask API server started")
             self.print_status('info', "Available at: http://localhost:5000/api/corridor/")
             
@@ -126,16 +198,14 @@ class VisualizationLauncher:
         urls_to_open = []
         
         # Check Plotly visualizations
-        if self.plotly_path.exists():
-            index_file = self.plotly_path / "index.html"
-            if index_file.exists():
-                file_url = f"file:///{index_file.absolute()}".replace('\\', '/')
-                urls_to_open.append(('Plotly Dashboard', file_url))
-                self.print_status('success', f"Plotly dashboard: {file_url}")
+        if self._have_plotly:
+            file_url = (self.plotly_path / "index.html").absolute().as_uri()
+            urls_to_open.append(('Plotly Dashboard', file_url))
+            self.print_status('success', f"Plotly dashboard: {file_url}")
         
         # Check HTML dashboard
-        if self.html_dashboard.exists():
-            file_url = f"file:///{self.html_dashboard.absolute()}".replace('\\', '/')
+        if self._have_dashboard:
+            file_url = self.html_dashboard.absolute().as_uri()
             urls_to_open.append(('Interactive Dashboard', file_url))
             self.print_status('success', f"Interactive dashboard: {file_url}")
         
@@ -143,13 +213,12 @@ class VisualizationLauncher:
         urls_to_open.append(('Flask API', 'http://localhost:5000/api/corridor/'))
         self.print_status('info', "Flask API: http://localhost:5000/api/corridor/")
         
-        # Open in browser
+        # Open in browser (the API socket is already listening, so no per-tab delay is needed)
         self.print_status('loading', "Opening visualizations in browser...")
         for name, url in urls_to_open:
             try:
                 webbrowser.open(url)
                 self.print_status('success', f"Opened: {name}")
-                time.sleep(1)  # Slight delay between opening
             except Exception as e:
                 self.print_status('warning', f"Could not open {name}: {e}")
         
@@ -241,12 +310,12 @@ class VisualizationLauncher:
         
         print("\n🎯 WHAT'S RUNNING:\n")
         
-        if self.plotly_path.exists() and (self.plotly_path / "index.html").exists():
+        if self._have_plotly:
             print("  ✓ Plotly Interactive Visualizations")
             print("    Location: visualization_outputs/")
             print("    Charts: Overview, AQI, Interventions, Zones, Time Series")
         
-        if self.html_dashboard.exists():
+        if self._have_dashboard:
             print("  ✓ Interactive HTML Dashboard")
             print("    Features: Multiple tabs, data export, real-time updates")
         
@@ -274,7 +343,12 @@ class VisualizationLauncher:
         try:
             if (Path("outputs") / "baseline_results.csv").exists():
                 import pandas as pd
-                df = pd.read_csv(Path("outputs") / "baseline_results.csv")
+                csv_path = Path("outputs") / "baseline_results.csv"
+                # Parse only the summarised columns (or the first one, just to count rows)
+                header = pd.read_csv(csv_path, nrows=0).columns
+                usecols = [c for c in ('flow_rate', 'speed') if c in header] or list(header[:1])
+                df = pd.read_csv(csv_path, usecols=usecols,
+                                 dtype={'flow_rate': 'float32', 'speed': 'float32'})
                 print(f"  • Baseline Results: {len(df)} segments")
                 if 'flow_rate' in df.columns:
                     print(f"    - Total Flow: {df['flow_rate'].sum():,.0f} vph")
@@ -290,12 +364,14 @@ class VisualizationLauncher:
         
         # Step 1: Generate Plotly visualizations
         plotly_success = self.generate_plotly_visualizations()
+        self._check_outputs()
         
         # Step 2: Start Flask server
         flask_thread = self.start_flask_server()
         
         # Step 3: Open visualizations
-        time.sleep(2)  # Wait for server to stabilize
+        if flask_thread is not None and not wait_port('127.0.0.1', 5000):
+            self.print_status('warning', "Flask API did not accept connections within 10s")
         urls = self.open_visualizations()
         
         # Step 4: Display summary and help
@@ -312,6 +388,7 @@ class VisualizationLauncher:
                 time.sleep(1)
         except KeyboardInterrupt:
             print("\n\n→ Shutting down visualization system...")
+            self.close()
             print("✓ Done!")
             sys.exit(0)
 
@@ -1,16 +1,16 @@
-import os
-import subprocess
+from src import simulation, interventions, ai_prescriptive, visualization
 
 # Run the full workflow: baseline, interventions, AI, visualization
+# (all stages share one interpreter, so pandas/sklearn are imported and the CSVs parsed once)
 def run_all():
     print('Running baseline simulation...')
-    subprocess.run(['python', 'src/simulation.py'])
+    simulation.main()
     print('Running interventions...')
-    subprocess.run(['python', 'src/interventions.py'])
+    interventions.main()
     print('Running AI prescriptive engine...')
-    subprocess.run(['python', 'src/ai_prescriptive.py'])
+    ai_prescriptive.main()
     print('Generating visualizations...')
-    subprocess.run(['python', 'src/visualization.py'])
+    visualization.main()
 
 if __name__ == '__main__':
     run_all()
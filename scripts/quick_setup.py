@@ -4,6 +4,7 @@ Quick Setup Script for AI for Climate Hackathon
 Run this to set up enhanced climate features quickly
 """
 
+import importlib.util
 import os
 import subprocess
 import sys
@@ -34,20 +35,24 @@ def setup_environment():
         print("❌ Python 3.8+ required. Please upgrade Python.")
         return False
     
-    # Install Python dependencies
-    requirements = [
-        "flask",
-        "flask-cors", 
-        "pandas",
-        "numpy",
-        "scikit-learn",
-        "matplotlib",
-        "seaborn",
-        "requests"
-    ]
-    
-    for package in requirements:
-        run_command(f"pip install {package}", f"Installing {package}")
+    # Install Python dependencies (pip name -> import name)
+    requirements = {
+        "flask": "flask",
+        "flask-cors": "flask_cors",
+        "pandas": "pandas",
+        "numpy": "numpy",
+        "scikit-learn": "sklearn",
+        "matplotlib": "matplotlib",
+        "seaborn": "seaborn",
+        "requests": "requests"
+    }
+    
+    # Only shell out to pip for what is missing; one pip run resolves them all together
+    missing = [pkg for pkg, module in requirements.items() if importlib.util.find_spec(module) is None]
+    if missing:
+        run_command(f"pip install {' '.join(missing)}", "Installing Python dependencies")
+    else:
+        print("\n✅ Python dependencies already installed")
     
     # Install Node.js dependencies
     if os.path.exists("package.json"):
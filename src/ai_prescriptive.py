@@ -1,69 +1,143 @@
 import pandas as pd
 import numpy as np
+from dataclasses import dataclass
 from .simulation import load_data, compute_energy_demand, compute_aqi, compute_heat_island, apply_intervention
-from sklearn.ensemble import GradientBoostingRegressor
+from sklearn.ensemble import HistGradientBoostingRegressor, RandomForestRegressor
+from sklearn.compose import TransformedTargetRegressor
+from sklearn.metrics import r2_score
+from sklearn.preprocessing import StandardScaler
 from sklearn.model_selection import train_test_split
+from joblib import Parallel, delayed, cpu_count
 
-# Generate random interventions
-def generate_random_interventions(zones, n=100):
-    interventions = []
-    for _ in range(n):
-        intervention = {}
-        for _, zone in zones.iterrows():
-            changes = {}
-            if np.random.rand() < 0.5:
-                changes['green_cover'] = np.clip(zone['green_cover'] + np.random.uniform(-0.05, 0.10), 0.05, 0.30)
-            if np.random.rand() < 0.5:
-                changes['traffic_flow'] = int(np.clip(zone['traffic_flow'] * np.random.uniform(0.8, 1.1), 800, 2000))
-            if np.random.rand() < 0.5:
-                changes['avg_building_age'] = int(np.clip(zone['avg_building_age'] + np.random.randint(-10, 5), 15, 50))
-            if changes:
-                intervention[zone['zone_id']] = changes
-        interventions.append(intervention)
-    return interventions
+# Levers an intervention may override, in the order of Interventions.mask's last axis
+_LEVERS = ('green_cover', 'traffic_flow', 'avg_building_age')
+
+@dataclass
+class Interventions:
+    """Batch of N interventions over Z zones, one (N, Z) array per lever"""
+    zone_ids: np.ndarray
+    green_cover: np.ndarray
+    traffic_flow: np.ndarray
+    avg_building_age: np.ndarray
+    mask: np.ndarray  # (N, Z, 3) bool: which levers each intervention changes, per zone
+
+    def __len__(self):
+        return len(self.mask)
+
+    def __getitem__(self, rows):
+        return Interventions(self.zone_ids, self.green_cover[rows], self.traffic_flow[rows],
+                             self.avg_building_age[rows], self.mask[rows])
+
+    @classmethod
+    def from_dicts(cls, interventions, zone_ids):
+        """Build from a list of {zone_id: {lever: value}} dicts"""
+        zone_idx = {zone_id: j for j, zone_id in enumerate(zone_ids)}
+        shape = (len(interventions), len(zone_ids))
+        values = {k: np.zeros(shape) for k in _LEVERS}
+        mask = np.zeros(shape + (len(_LEVERS),), dtype=bool)
+        for i, intervention in enumerate(interventions):
+            for zone_id, changes in intervention.items():
+                j = zone_idx[zone_id]
+                for k, v in changes.items():
+                    values[k][i, j] = v
+                    mask[i, j, _LEVERS.index(k)] = True
+        return cls(np.asarray(zone_ids), mask=mask, **values)
+
+    def to_dicts(self):
+        """List of {zone_id: {lever: value}} dicts, omitting zones an intervention leaves alone"""
+        zone_ids = self.zone_ids.tolist()
+        columns = (self.green_cover.tolist(), self.traffic_flow.tolist(), self.avg_building_age.tolist())
+        interventions = []
+        for i, row_mask in enumerate(self.mask.tolist()):
+            intervention = {}
+            for j, zone_id in enumerate(zone_ids):
+                changes = {k: col[i][j] for k, col, m in zip(_LEVERS, columns, row_mask[j]) if m}
+                if changes:
+                    intervention[zone_id] = changes
+            interventions.append(intervention)
+        return interventions
+
+# Generate random interventions (all draws are taken up front as (n, zones) batches)
+def generate_random_interventions(zones, n=100, seed=None):
+    rng = np.random.default_rng(seed)
+    z = len(zones)
+    mask = rng.random((n, z, 3)) < 0.5
+    green = np.clip(zones['green_cover'].to_numpy() + rng.uniform(-0.05, 0.10, (n, z)), 0.05, 0.30)
+    tflow = np.clip(zones['traffic_flow'].to_numpy() * rng.uniform(0.8, 1.1, (n, z)), 800, 2000).astype(int)
+    age = np.clip(zones['avg_building_age'].to_numpy() + rng.integers(-10, 5, (n, z)), 15, 50).astype(int)
+    return Interventions(zones['zone_id'].to_numpy(), green, tflow, age, mask)
 
 def simulate_interventions(interventions, day=1):
+    """interventions: an Interventions batch, or a list of {zone_id: {lever: value}} dicts"""
     zones, weather, traffic = load_data()
     temp = weather.loc[weather['day'] == day, 'temperature'].values[0]
-    X, y_energy, y_aqi, y_heat = [], [], [], []
-    for intervention in interventions:
-        zones_copy = zones.copy()
-        traffic_copy = traffic.copy()
-        for zone_id, changes in intervention.items():
-            idx = zones_copy[zones_copy['zone_id'] == zone_id].index[0]
-            for k, v in changes.items():
-                if k == 'traffic_flow':
-                    traffic_copy.loc[(traffic_copy['zone_id'] == zone_id) & (traffic_copy['day'] == day), 'traffic_flow'] = v
-                else:
-                    zones_copy.at[idx, k] = v
-        for i, zone in zones_copy.iterrows():
-            tflow = traffic_copy[(traffic_copy['zone_id'] == zone['zone_id']) & (traffic_copy['day'] == day)]['traffic_flow'].values[0]
-            energy = compute_energy_demand(zone, temp)
-            aqi = compute_aqi(zone, tflow, {'temperature': temp})
-            heat = compute_heat_island(zone)
-            X.append([
-                zone['zone_id'], zone['population'], tflow, zone['avg_building_age'],
-                zone['green_cover'], zone['industrial_activity']
-            ])
-            y_energy.append(energy)
-            y_aqi.append(aqi)
-            y_heat.append(heat)
-    return np.array(X), np.array(y_energy), np.array(y_aqi), np.array(y_heat)
+    zone_ids = zones['zone_id'].to_numpy()
+    if not isinstance(interventions, Interventions):
+        interventions = Interventions.from_dicts(interventions, zone_ids)
+    n, n_zones = len(interventions), len(zones)
+    # Wide (zone x day) view of the long traffic table; one column read gives every zone's flow
+    traffic_wide = traffic.pivot(index='zone_id', columns='day', values='traffic_flow')
+    base_tflow = traffic_wide[day].to_numpy()[traffic_wide.index.get_indexer(zone_ids)]
+    
+    # Unchanged columns stay read-only broadcast views of the baseline; each lever takes
+    # its intervention value wherever the mask is set
+    grid = {col: np.broadcast_to(zones[col].to_numpy(dtype=float), (n, n_zones)) for col in zones.columns}
+    grid['traffic_flow'] = np.broadcast_to(base_tflow, (n, n_zones))
+    for j, k in enumerate(_LEVERS):
+        grid[k] = np.where(interventions.mask[..., j], getattr(interventions, k), grid[k])
+    tflow = grid['traffic_flow']
+    
+    # Physics runs in float64; features and targets are stored as float32 for training
+    y_energy = compute_energy_demand(grid, temp).ravel().astype(np.float32)
+    y_aqi = compute_aqi(grid, tflow, {'temperature': temp}).ravel().astype(np.float32)
+    y_heat = compute_heat_island(grid).ravel().astype(np.float32)
+    X = np.empty((n, n_zones, 6), dtype=np.float32)
+    for j, col in enumerate([grid['zone_id'], grid['population'], tflow, grid['avg_building_age'],
+                             grid['green_cover'], grid['industrial_activity']]):
+        X[..., j] = col
+    X = X.reshape(-1, 6)
+    return X, y_energy, y_aqi, y_heat
+
+def simulate_interventions_parallel(interventions, day=1, n_jobs=-1):
+    """simulate_interventions over contiguous chunks on a loky worker pool; same outputs.
+    Worker startup costs seconds, so only worth it for batches of ~1e5+ interventions
+    (the serial call handles a few hundred in milliseconds)."""
+    n_chunks = max(1, min(len(interventions), cpu_count() if n_jobs == -1 else n_jobs))
+    bounds = np.linspace(0, len(interventions), n_chunks + 1).astype(int)
+    results = Parallel(n_jobs=n_jobs, backend='loky')(
+        delayed(simulate_interventions)(interventions[lo:hi], day) for lo, hi in zip(bounds[:-1], bounds[1:])
+    )
+    return tuple(np.concatenate(parts) for parts in zip(*results))
 
 def train_surrogate(X, y):
     X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
-    model = GradientBoostingRegressor()
+    model = HistGradientBoostingRegressor(max_iter=200, max_bins=255, early_stopping=True)
     model.fit(X_train, y_train)
     print(f"Surrogate R^2: {model.score(X_test, y_test):.2f}")
     return model
 
-if __name__ == '__main__':
+# One multi-output forest for all targets: each tree split is searched over X once, not per target.
+# Targets are standardized so energy (~1e3) does not drown out heat island (~1e-1) in the split criterion.
+def train_surrogates(X, Y, names):
+    X_train, X_test, Y_train, Y_test = train_test_split(X, Y, test_size=0.2, random_state=42)
+    model = TransformedTargetRegressor(
+        regressor=RandomForestRegressor(n_estimators=200, n_jobs=-1, random_state=42),
+        transformer=StandardScaler(),
+    )
+    model.fit(X_train, Y_train)
+    scores = r2_score(Y_test, model.predict(X_test), multioutput='raw_values')
+    for name, score in zip(names, scores):
+        print(f"Surrogate R^2 ({name}): {score:.2f}")
+    return model
+
+def main():
     zones, _, _ = load_data()
     interventions = generate_random_interventions(zones, n=100)
     X, y_energy, y_aqi, y_heat = simulate_interventions(interventions)
-    print('Training surrogate for AQI...')
-    surrogate_aqi = train_surrogate(X, y_aqi)
-    print('Training surrogate for energy...')
-    surrogate_energy = train_surrogate(X, y_energy)
-    print('Training surrogate for heat island...')
-    surrogate_heat = train_surrogate(X, y_heat)
+    print('Training surrogates for AQI, energy and heat island...')
+    surrogates = train_surrogates(X, np.column_stack([y_aqi, y_energy, y_heat]),
+                                  ['AQI', 'energy', 'heat island'])
+    return surrogates
+
+if __name__ == '__main__':
+    main()
@@ -9,137 +9,204 @@ from sklearn.ensemble import RandomForestRegressor, GradientBoostingRegressor
 from sklearn.linear_model import LinearRegression
 from typing import Dict, List, Tuple
 import datetime
+from types import MappingProxyType
+from functools import lru_cache
+
+# Per-hectare parameters for each green infrastructure intervention
+_GREEN_INFRASTRUCTURE = MappingProxyType({
+    'urban_forest': {
+        'cost_per_hectare': 0.5,  # ₹50 lakhs per hectare
+        'co2_sequestration_tons_year': 22,  # tons CO2 per hectare per year
+        'cooling_effect_celsius': 2.5,
+        'air_quality_improvement': 15,  # % AQI improvement
+        'biodiversity_score': 85
+    },
+    'green_roofs': {
+        'cost_per_hectare': 1.2,  # ₹1.2 crores per hectare
+        'co2_sequestration_tons_year': 8,
+        'cooling_effect_celsius': 1.8,
+        'air_quality_improvement': 8,
+        'biodiversity_score': 45
+    },
+    'vertical_gardens': {
+        'cost_per_hectare': 0.8,  # ₹80 lakhs per hectare
+        'co2_sequestration_tons_year': 12,
+        'cooling_effect_celsius': 1.2,
+        'air_quality_improvement': 10,
+        'biodiversity_score': 55
+    }
+})
+
+def _green_infrastructure_roi(intervention: Dict) -> Dict:
+    """ROI summary for one intervention's parameters"""
+    
+    # Economic benefits
+    carbon_credit_value = intervention['co2_sequestration_tons_year'] * 2000  # ₹2000 per ton CO2
+    cooling_savings = intervention['cooling_effect_celsius'] * 100000  # ₹1 lakh per degree cooling
+    health_benefits = intervention['air_quality_improvement'] * 50000  # ₹50k per % AQI improvement
+    
+    annual_benefits = carbon_credit_value + cooling_savings + health_benefits
+    payback_years = intervention['cost_per_hectare'] * 10000000 / annual_benefits  # Convert crores to rupees
+    
+    return {
+        'investment_crores': intervention['cost_per_hectare'],
+        'annual_benefits_lakhs': annual_benefits / 100000,
+        'payback_years': payback_years,
+        'co2_sequestration': intervention['co2_sequestration_tons_year'],
+        'cooling_effect': intervention['cooling_effect_celsius'],
+        'air_quality_improvement': intervention['air_quality_improvement'],
+        'biodiversity_score': intervention['biodiversity_score'],
+        'roi_percentage': (annual_benefits / (intervention['cost_per_hectare'] * 10000000)) * 100
+    }
+
+# Every input is a constant, so the ROI table is computed once at import
+_GREEN_INFRASTRUCTURE_ROI = MappingProxyType({
+    name: _green_infrastructure_roi(params) for name, params in _GREEN_INFRASTRUCTURE.items()
+})
+
+# Net-zero intervention scenarios, one row each
+_NET_ZERO_SCENARIOS = np.array([
+    ('aggressive', 0.8, 0.9, 0.7, 10),
+    ('moderate', 0.5, 0.6, 0.4, 15),
+    ('conservative', 0.3, 0.4, 0.2, 20),
+], dtype=[('name', 'U12'), ('ev_adoption', 'f8'), ('renewable_energy', 'f8'),
+          ('green_buildings', 'f8'), ('timeline_years', 'i8')])
+
+# Pathways depend only on the emissions figure; dashboards ask for the same zones repeatedly
+@lru_cache(maxsize=1024)
+def _net_zero_pathway(current_emissions: float) -> Dict:
+    """Pathway for every scenario, computed with (3,) array ops"""
+    scenarios = _NET_ZERO_SCENARIOS
+
+    # Calculate emission reductions for all scenarios at once
+    traffic_reduction = current_emissions * 0.4 * scenarios['ev_adoption']
+    energy_reduction = current_emissions * 0.35 * scenarios['renewable_energy']
+    building_reduction = current_emissions * 0.25 * scenarios['green_buildings']
+
+    total_reduction = traffic_reduction + energy_reduction + building_reduction
+    remaining_emissions = np.maximum(0, current_emissions - total_reduction)
+
+    columns = zip((2024 + scenarios['timeline_years']).tolist(),
+                  ((total_reduction / current_emissions) * 100).tolist(),
+                  remaining_emissions.tolist(),
+                  (total_reduction * 50).tolist())  # ₹50 crores per ton reduction
+    return {
+        scenario_name: {
+            'target_year': target_year,
+            'emission_reduction_percent': reduction_percent,
+            'remaining_emissions': remaining,
+            'carbon_offset_needed': remaining,
+            'investment_required_crores': investment
+        }
+        for scenario_name, (target_year, reduction_percent, remaining, investment)
+        in zip(scenarios['name'].tolist(), columns)
+    }
+
+def _frozen(values) -> np.ndarray:
+    """Read-only float array, safe to share between every ClimateAI instance"""
+    arr = np.array(values, dtype=np.float64)
+    arr.flags.writeable = False
+    return arr
+
+# Positions in ClimateAI._CARBON
+CF_TRAFFIC, CF_INDUSTRY, CF_BUILDINGS, CF_WASTE = range(4)
 
 class ClimateAI:
     """Advanced climate modeling and carbon tracking"""
     
-    def __init__(self):
-        self.carbon_factors = {
-            'traffic': 0.21,  # kg CO2 per km per vehicle
-            'industry': 2.3,  # kg CO2 per kWh industrial
-            'buildings': 0.85,  # kg CO2 per kWh residential
-            'waste': 0.5      # kg CO2 per kg waste
-        }
-        self.renewable_potential = {
-            1: {'solar': 0.8, 'wind': 0.3},  # Connaught Place
-            2: {'solar': 0.7, 'wind': 0.4},  # Karol Bagh  
-            3: {'solar': 0.9, 'wind': 0.6},  # Dwarka
-            4: {'solar': 0.8, 'wind': 0.5},  # Rohini
-            5: {'solar': 0.7, 'wind': 0.3}   # Saket
-        }
+    _CARBON = _frozen([
+        0.21,  # traffic: kg CO2 per km per vehicle
+        2.3,   # industry: kg CO2 per kWh industrial
+        0.85,  # buildings: kg CO2 per kWh residential
+        0.5    # waste: kg CO2 per kg waste
+    ])
+    # Renewable potential indexed by zone_id - 1:
+    # Connaught Place, Karol Bagh, Dwarka, Rohini, Saket
+    _SOLAR = _frozen([0.8, 0.7, 0.9, 0.8, 0.7])
+    _WIND = _frozen([0.3, 0.4, 0.6, 0.5, 0.3])
         
     def calculate_carbon_emissions(self, zone_data: Dict) -> Dict:
         """Calculate real-time carbon emissions per zone"""
-        emissions = {}
+        # One row per zone: traffic_flow, energy_use, industrial_activity, population
+        cols = np.array([
+            (data['traffic_flow'], data['energy_use'],
+             data.get('industrial_activity', 0.5), data.get('population', 15000))
+            for data in zone_data.values()
+        ], dtype=np.float64).reshape(-1, 4)
         
-        for zone_id, data in zone_data.items():
-            # Traffic emissions
-            traffic_co2 = data['traffic_flow'] * 10 * self.carbon_factors['traffic']  # 10km avg journey
-            
-            # Building emissions  
-            building_co2 = data['energy_use'] * self.carbon_factors['buildings']
-            
-            # Industrial emissions
-            industrial_co2 = data.get('industrial_activity', 0.5) * 1000 * self.carbon_factors['industry']
-            
-            total_co2 = traffic_co2 + building_co2 + industrial_co2
-            
-            emissions[zone_id] = {
-                'total_co2_tons': total_co2 / 1000,  # Convert to tons
-                'traffic_co2': traffic_co2 / 1000,
-                'building_co2': building_co2 / 1000,
-                'industrial_co2': industrial_co2 / 1000,
-                'per_capita_co2': (total_co2 / 1000) / (data.get('population', 15000) / 1000)
+        traffic_co2 = cols[:, 0] * 10 * self._CARBON[CF_TRAFFIC]  # 10km avg journey
+        building_co2 = cols[:, 1] * self._CARBON[CF_BUILDINGS]
+        industrial_co2 = cols[:, 2] * 1000 * self._CARBON[CF_INDUSTRY]
+        total_co2 = traffic_co2 + building_co2 + industrial_co2
+        per_capita_co2 = (total_co2 / 1000) / (cols[:, 3] / 1000)
+        
+        columns = zip((total_co2 / 1000).tolist(), (traffic_co2 / 1000).tolist(),
+                      (building_co2 / 1000).tolist(), (industrial_co2 / 1000).tolist(),
+                      per_capita_co2.tolist())
+        return {
+            zone_id: {
+                'total_co2_tons': total,  # Convert to tons
+                'traffic_co2': traffic,
+                'building_co2': building,
+                'industrial_co2': industrial,
+                'per_capita_co2': per_capita
             }
-            
-        return emissions
+            for zone_id, (total, traffic, building, industrial, per_capita) in zip(zone_data, columns)
+        }
     
     def predict_net_zero_pathway(self, zone_id: int, current_emissions: float) -> Dict:
         """Predict pathway to net-zero emissions"""
-        
-        # Intervention scenarios
-        scenarios = {
-            'aggressive': {
-                'ev_adoption': 0.8,
-                'renewable_energy': 0.9,
-                'green_buildings': 0.7,
-                'timeline_years': 10
-            },
-            'moderate': {
-                'ev_adoption': 0.5,
-                'renewable_energy': 0.6,
-                'green_buildings': 0.4,
-                'timeline_years': 15
-            },
-            'conservative': {
-                'ev_adoption': 0.3,
-                'renewable_energy': 0.4,
-                'green_buildings': 0.2,
-                'timeline_years': 20
-            }
-        }
-        
-        pathways = {}
-        for scenario_name, scenario in scenarios.items():
-            # Calculate emission reductions
-            traffic_reduction = current_emissions * 0.4 * scenario['ev_adoption']
-            energy_reduction = current_emissions * 0.35 * scenario['renewable_energy'] 
-            building_reduction = current_emissions * 0.25 * scenario['green_buildings']
-            
-            total_reduction = traffic_reduction + energy_reduction + building_reduction
-            remaining_emissions = max(0, current_emissions - total_reduction)
-            
-            pathways[scenario_name] = {
-                'target_year': 2024 + scenario['timeline_years'],
-                'emission_reduction_percent': (total_reduction / current_emissions) * 100,
-                'remaining_emissions': remaining_emissions,
-                'carbon_offset_needed': max(0, remaining_emissions),
-                'investment_required_crores': total_reduction * 50  # ₹50 crores per ton reduction
-            }
-            
-        return pathways
+        # Copies, so callers can't edit the memoized result
+        return {name: dict(pathway) for name, pathway in _net_zero_pathway(current_emissions).items()}
     
     def optimize_renewable_energy(self, zone_data: Dict) -> Dict:
         """AI-optimized renewable energy placement"""
         
-        recommendations = {}
+        ids = np.fromiter(zone_data.keys(), dtype=np.int64, count=len(zone_data))
+        unknown = ids[(ids < 1) | (ids > len(self._SOLAR))]
+        if unknown.size:
+            raise KeyError(int(unknown[0]))
+        solar_potential = self._SOLAR[ids - 1]
+        wind_potential = self._WIND[ids - 1]
         
-        for zone_id, data in zone_data.items():
-            solar_potential = self.renewable_potential[zone_id]['solar']
-            wind_potential = self.renewable_potential[zone_id]['wind']
-            
-            # Calculate optimal renewable mix
-            energy_demand = data['energy_use']
-            
-            # Solar capacity (MW)
-            optimal_solar = energy_demand * 0.6 * solar_potential
-            
-            # Wind capacity (MW)  
-            optimal_wind = energy_demand * 0.4 * wind_potential
-            
-            # Battery storage (MWh)
-            battery_capacity = (optimal_solar + optimal_wind) * 0.25
-            
-            # Economic analysis
-            solar_cost = optimal_solar * 4.5  # ₹4.5 crores per MW
-            wind_cost = optimal_wind * 6.0   # ₹6 crores per MW
-            battery_cost = battery_capacity * 2.0  # ₹2 crores per MWh
-            
-            total_investment = solar_cost + wind_cost + battery_cost
-            annual_savings = energy_demand * 0.06 * 8760  # ₹6/kWh savings
-            payback_years = total_investment / (annual_savings / 10000000)  # Convert to crores
-            
-            recommendations[zone_id] = {
-                'solar_mw': optimal_solar,
-                'wind_mw': optimal_wind,
-                'battery_mwh': battery_capacity,
-                'investment_crores': total_investment,
-                'annual_savings_crores': annual_savings / 10000000,
-                'payback_years': payback_years,
-                'co2_reduction_tons_year': (optimal_solar + optimal_wind) * 8760 * 0.85 / 1000  # 0.85 kg CO2/kWh
+        # Calculate optimal renewable mix
+        energy_demand = np.fromiter((data['energy_use'] for data in zone_data.values()),
+                                    dtype=np.float64, count=len(zone_data))
+        
+        # Solar capacity (MW)
+        optimal_solar = energy_demand * 0.6 * solar_potential
+        
+        # Wind capacity (MW)
+        optimal_wind = energy_demand * 0.4 * wind_potential
+        
+        # Battery storage (MWh)
+        battery_capacity = (optimal_solar + optimal_wind) * 0.25
+        
+        # Economic analysis
+        solar_cost = optimal_solar * 4.5  # ₹4.5 crores per MW
+        wind_cost = optimal_wind * 6.0   # ₹6 crores per MW
+        battery_cost = battery_capacity * 2.0  # ₹2 crores per MWh
+        
+        total_investment = solar_cost + wind_cost + battery_cost
+        annual_savings = energy_demand * 0.06 * 8760  # ₹6/kWh savings
+        payback_years = total_investment / (annual_savings / 10000000)  # Convert to crores
+        co2_reduction = (optimal_solar + optimal_wind) * 8760 * 0.85 / 1000  # 0.85 kg CO2/kWh
+        
+        columns = zip(optimal_solar.tolist(), optimal_wind.tolist(), battery_capacity.tolist(),
+                      total_investment.tolist(), (annual_savings / 10000000).tolist(),
+                      payback_years.tolist(), co2_reduction.tolist())
+        return {
+            zone_id: {
+                'solar_mw': solar,
+                'wind_mw': wind,
+                'battery_mwh': battery,
+                'investment_crores': investment,
+                'annual_savings_crores': savings,
+                'payback_years': payback,
+                'co2_reduction_tons_year': co2
             }
-            
-        return recommendations
+            for zone_id, (solar, wind, battery, investment, savings, payback, co2) in zip(zone_data, columns)
+        }
     
     def predict_climate_risks(self, weather_data: Dict) -> Dict:
         """Predict extreme weather and climate risks"""
@@ -148,12 +215,14 @@ class ClimateAI:
         humidity = weather_data.get('humidity', 60)
         
         # Simple risk assessment (would use complex ML models in production)
-        risks = {
-            'heatwave_risk': min(100, max(0, (current_temp - 40) * 10)),
-            'flood_risk': min(100, max(0, (humidity - 80) * 5)),
-            'air_quality_risk': min(100, max(0, (current_temp - 35) * 3 + (humidity - 50) * 2)),
-            'drought_risk': min(100, max(0, (45 - current_temp) * 2 + (50 - humidity) * 1.5))
-        }
+        risk_scores = np.clip(np.array([
+            (current_temp - 40) * 10,                                 # heatwave
+            (humidity - 80) * 5,                                      # flood
+            (current_temp - 35) * 3 + (humidity - 50) * 2,            # air quality
+            (45 - current_temp) * 2 + (50 - humidity) * 1.5           # drought
+        ], dtype=np.float64), 0, 100)
+        risks = dict(zip(('heatwave_risk', 'flood_risk', 'air_quality_risk', 'drought_risk'),
+                         risk_scores.tolist()))
         
         # Generate alerts
         alerts = []
@@ -167,59 +236,13 @@ class ClimateAI:
         return {
             'risk_scores': risks,
             'alerts': alerts,
-            'overall_climate_risk': sum(risks.values()) / len(risks)
+            'overall_climate_risk': float(risk_scores.mean())
         }
     
     def calculate_green_infrastructure_roi(self, intervention_type: str, zone_id: int) -> Dict:
         """Calculate ROI for green infrastructure investments"""
-        
-        interventions = {
-            'urban_forest': {
-                'cost_per_hectare': 0.5,  # ₹50 lakhs per hectare
-                'co2_sequestration_tons_year': 22,  # tons CO2 per hectare per year
-                'cooling_effect_celsius': 2.5,
-                'air_quality_improvement': 15,  # % AQI improvement
-                'biodiversity_score': 85
-            },
-            'green_roofs': {
-                'cost_per_hectare': 1.2,  # ₹1.2 crores per hectare
-                'co2_sequestration_tons_year': 8,
-                'cooling_effect_celsius': 1.8,
-                'air_quality_improvement': 8,
-                'biodiversity_score': 45
-            },
-            'vertical_gardens': {
-                'cost_per_hectare': 0.8,  # ₹80 lakhs per hectare
-                'co2_sequestration_tons_year': 12,
-                'cooling_effect_celsius': 1.2,
-                'air_quality_improvement': 10,
-                'biodiversity_score': 55
-            }
-        }
-        
-        if intervention_type not in interventions:
-            return {}
-            
-        intervention = interventions[intervention_type]
-        
-        # Economic benefits
-        carbon_credit_value = intervention['co2_sequestration_tons_year'] * 2000  # ₹2000 per ton CO2
-        cooling_savings = intervention['cooling_effect_celsius'] * 100000  # ₹1 lakh per degree cooling
-        health_benefits = intervention['air_quality_improvement'] * 50000  # ₹50k per % AQI improvement
-        
-        annual_benefits = carbon_credit_value + cooling_savings + health_benefits
-        payback_years = intervention['cost_per_hectare'] * 10000000 / annual_benefits  # Convert crores to rupees
-        
-        return {
-            'investment_crores': intervention['cost_per_hectare'],
-            'annual_benefits_lakhs': annual_benefits / 100000,
-            'payback_years': payback_years,
-            'co2_sequestration': intervention['co2_sequestration_tons_year'],
-            'cooling_effect': intervention['cooling_effect_celsius'],
-            'air_quality_improvement': intervention['air_quality_improvement'],
-            'biodiversity_score': intervention['biodiversity_score'],
-            'roi_percentage': (annual_benefits / (intervention['cost_per_hectare'] * 10000000)) * 100
-        }
+        roi = _GREEN_INFRASTRUCTURE_ROI.get(intervention_type)
+        return dict(roi) if roi is not None else {}
 
 # Usage example
 if __name__ == "__main__":
@@ -1,32 +1,76 @@
 """
 Generate professional matplotlib/seaborn visualizations for Emergency Protocol results
+Render-only: figures are drawn off-screen with the Agg backend, never shown
 """
-import matplotlib.pyplot as plt
-import seaborn as sns
 import numpy as np
 from pathlib import Path
 import base64
 from io import BytesIO
+from collections import OrderedDict
+import threading
 
-# Set style
-sns.set_theme(style="darkgrid", palette="husl")
-plt.rcParams['figure.facecolor'] = '#1a1a2e'
-plt.rcParams['axes.facecolor'] = '#16213e'
-plt.rcParams['text.color'] = 'white'
-plt.rcParams['axes.labelcolor'] = 'white'
-plt.rcParams['xtick.color'] = 'white'
-plt.rcParams['ytick.color'] = 'white'
+# pyplot, imported and styled on the first render so importing this module stays cheap
+_plt = None
 
-def generate_graphs(baseline_zones, emergency_zones):
-    """Generate all graphs and return as base64 encoded images"""
-    
-    graphs = {}
+def _pyplot():
+    global _plt
+    if _plt is None:
+        # Agg before pyplot loads, so server workers never probe for a GUI toolkit
+        import matplotlib
+        matplotlib.use('Agg')
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+        
+        # Set style
+        sns.set_theme(style="darkgrid", palette="husl")
+        plt.rcParams.update({
+            'figure.facecolor': '#1a1a2e',
+            'axes.facecolor': '#16213e',
+            'text.color': 'white',
+            'axes.labelcolor': 'white',
+            'xtick.color': 'white',
+            'ytick.color': 'white',
+        })
+        _plt = plt
+    return _plt
+
+# Rendered graphs keyed by (zone_names, baseline_aqi, emergency_aqi), most recently used last
+_GRAPH_CACHE = OrderedDict()
+_GRAPH_CACHE_SIZE = 64
+_GRAPH_CACHE_LOCK = threading.Lock()  # the Flask API serves requests from several threads
+
+def generate_graphs(baseline_zones, emergency_zones, encode='base64'):
+    """Generate all graphs and return as base64 encoded images (encode='bytes': raw image bytes)"""
+    if encode not in ('base64', 'bytes'):
+        raise ValueError(f"encode must be 'base64' or 'bytes', not {encode!r}")
     
     # Extract data
     zone_names = [z.get('name', f"Zone {i+1}") for i, z in enumerate(baseline_zones)]
-    baseline_aqi = [z.get('aqi', 0) for z in baseline_zones]
-    emergency_aqi = [z.get('aqi', 0) for z in emergency_zones]
-    aqi_reduction = [b - e for b, e in zip(baseline_aqi, emergency_aqi)]
+    baseline_aqi = np.fromiter((z.get('aqi', 0) for z in baseline_zones), dtype=np.float64, count=len(baseline_zones))
+    emergency_aqi = np.fromiter((z.get('aqi', 0) for z in emergency_zones), dtype=np.float64, count=len(emergency_zones))
+    
+    # Dashboards re-request the same zone data; skip matplotlib entirely on a repeat
+    key = (tuple(zone_names), tuple(baseline_aqi.tolist()), tuple(emergency_aqi.tolist()))
+    with _GRAPH_CACHE_LOCK:
+        graphs = _GRAPH_CACHE.get(key)
+        if graphs is not None:
+            _GRAPH_CACHE.move_to_end(key)
+    if graphs is None:
+        graphs = _render_graphs(zone_names, baseline_aqi, emergency_aqi)
+        with _GRAPH_CACHE_LOCK:
+            _GRAPH_CACHE[key] = graphs
+            if len(_GRAPH_CACHE) > _GRAPH_CACHE_SIZE:
+                _GRAPH_CACHE.popitem(last=False)
+    if encode == 'bytes':
+        return dict(graphs)
+    return {name: to_data_uri(image) for name, image in graphs.items()}
+
+def _render_graphs(zone_names, baseline_aqi, emergency_aqi):
+    """Draw the four comparison charts; returns {graph name: encoded image bytes}"""
+    
+    plt = _pyplot()
+    graphs = {}
+    aqi_reduction = baseline_aqi - emergency_aqi
     
     # 1. AQI Comparison - Side by side bars
     fig, ax = plt.subplots(figsize=(12, 6))
@@ -53,12 +97,12 @@ def generate_graphs(baseline_zones, emergency_zones):
                    ha='center', va='bottom', fontsize=9, fontweight='bold', color='white')
     
     fig.tight_layout()
-    graphs['aqi_comparison'] = fig_to_base64(fig)
+    graphs['aqi_comparison'] = fig_to_bytes(fig)
     plt.close(fig)
     
     # 2. AQI Reduction Impact
     fig, ax = plt.subplots(figsize=(12, 6))
-    colors = ['#10b981' if x > 40 else '#f59e0b' if x > 20 else '#ef4444' for x in aqi_reduction]
+    colors = np.where(aqi_reduction > 40, '#10b981', np.where(aqi_reduction > 20, '#f59e0b', '#ef4444')).tolist()
     bars = ax.barh(zone_names, aqi_reduction, color=colors, alpha=0.8)
     
     ax.set_xlabel('AQI Reduction Points', fontsize=12, fontweight='bold')
@@ -73,13 +117,14 @@ def generate_graphs(baseline_zones, emergency_zones):
                ha='left', va='center', fontsize=11, fontweight='bold', color='white')
     
     fig.tight_layout()
-    graphs['aqi_reduction'] = fig_to_base64(fig)
+    graphs['aqi_reduction'] = fig_to_bytes(fig)
     plt.close(fig)
     
     # 3. Percentage Reduction
     fig, ax = plt.subplots(figsize=(12, 6))
-    pct_reduction = [(b - e) / b * 100 if b > 0 else 0 for b, e in zip(baseline_aqi, emergency_aqi)]
-    colors_pct = ['#10b981' if x > 15 else '#f59e0b' for x in pct_reduction]
+    pct_reduction = np.divide(aqi_reduction, baseline_aqi, out=np.zeros_like(aqi_reduction),
+                              where=baseline_aqi > 0) * 100
+    colors_pct = np.where(pct_reduction > 15, '#10b981', '#f59e0b').tolist()
     bars = ax.bar(zone_names, pct_reduction, color=colors_pct, alpha=0.8)
     
     ax.set_ylabel('Reduction (%)', fontsize=12, fontweight='bold')
@@ -95,7 +140,7 @@ def generate_graphs(baseline_zones, emergency_zones):
                ha='center', va='bottom', fontsize=10, fontweight='bold', color='white')
     
     fig.tight_layout()
-    graphs['percentage_reduction'] = fig_to_base64(fig)
+    graphs['percentage_reduction'] = fig_to_bytes(fig)
     plt.close(fig)
     
     # 4. Before/After Line Chart
@@ -112,19 +157,43 @@ def generate_graphs(baseline_zones, emergency_zones):
     ax.set_xticklabels(zone_names, rotation=45, ha='right')
     
     fig.tight_layout()
-    graphs['trend_chart'] = fig_to_base64(fig)
+    graphs['trend_chart'] = fig_to_bytes(fig)
     plt.close(fig)
     
     return graphs
 
+def _image_format():
+    """Lossless WebP (~4x smaller than PNG for these flat-colour charts) when Pillow can write it"""
+    try:
+        from PIL import features
+        return 'webp' if features.check('webp') else 'png'
+    except ImportError:
+        return 'png'
+
+IMAGE_FORMAT = _image_format()
+
+# One reusable encode buffer per thread (the Flask API renders from several)
+_buffers = threading.local()
+
+def fig_to_bytes(fig):
+    """Encode a matplotlib figure as IMAGE_FORMAT bytes"""
+    buffer = getattr(_buffers, 'buffer', None)
+    if buffer is None:
+        buffer = _buffers.buffer = BytesIO()
+    buffer.seek(0)
+    buffer.truncate()
+    # Every figure is tight_layout()-ed already; bbox_inches='tight' would cost a second draw pass
+    fig.savefig(buffer, format=IMAGE_FORMAT, facecolor='#1a1a2e', edgecolor='#667eea',
+                pil_kwargs={'lossless': True} if IMAGE_FORMAT == 'webp' else None)
+    return buffer.getvalue()
+
+def to_data_uri(image):
+    """Wrap encoded image bytes as a base64 data URI for <img src>"""
+    return f"data:image/{IMAGE_FORMAT};base64,{base64.b64encode(image).decode()}"
+
 def fig_to_base64(fig):
     """Convert matplotlib figure to base64 encoded string"""
-    buffer = BytesIO()
-    fig.savefig(buffer, format='png', bbox_inches='tight', facecolor='#1a1a2e', edgecolor='#667eea')
-    buffer.seek(0)
-    image_base64 = base64.b64encode(buffer.read()).decode()
-    buffer.close()
-    return f"data:image/png;base64,{image_base64}"
+    return to_data_uri(fig_to_bytes(fig))
 
 # Export for use in React
 if __name__ == '__main__':
@@ -145,7 +214,7 @@ if __name__ == '__main__':
         {'name': 'Zone 5', 'aqi': 260}
     ]
     
-    graphs = generate_graphs(baseline, emergency)
+    graphs = generate_graphs(baseline, emergency, encode='bytes')
     print(f"Generated {len(graphs)} graphs")
     for name, data in graphs.items():
         print(f"{name}: {len(data)} bytes")
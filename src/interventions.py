@@ -1,6 +1,10 @@
+import csv
 import pandas as pd
 import numpy as np
-from simulation import load_data, compute_energy_demand, compute_aqi, compute_heat_island, apply_intervention
+try:
+    from .simulation import load_data, compute_energy_demand, compute_aqi, compute_heat_island, apply_intervention
+except ImportError:  # run as a script: python src/interventions.py
+    from simulation import load_data, compute_energy_demand, compute_aqi, compute_heat_island, apply_intervention
 
 # Example interventions
 def intervention_examples():
@@ -16,31 +20,52 @@ def run_interventions(day=1):
     zones, weather, traffic = load_data()
     temp = weather.loc[weather['day'] == day, 'temperature'].values[0]
     interventions = intervention_examples()
-    all_results = []
-    for intervention in interventions:
-        zones_copy = zones.copy()
+    # This day's flows as an array over the traffic table's zones; edits are O(1) writes
+    # and, as before, carry over into the interventions that follow
+    traffic_wide = traffic.pivot(index='zone_id', columns='day', values='traffic_flow')
+    traffic_row = {zone_id: i for i, zone_id in enumerate(traffic_wide.index)}
+    day_flow = traffic_wide[day].to_numpy(dtype=float)
+    zone_rows = traffic_wide.index.get_indexer(zones['zone_id'])
+    # One (interventions x zones) grid per attribute; untouched attributes stay broadcast views
+    # of the baseline, edited ones are copied once and patched per intervention row
+    n = len(interventions)
+    grid = {col: np.broadcast_to(zones[col].to_numpy(dtype=float), (n, len(zones))) for col in zones.columns}
+    zone_pos = {zone_id: i for i, zone_id in enumerate(zones['zone_id'])}
+    tflow = np.empty((n, len(zones)))
+    for i, intervention in enumerate(interventions):
         for zone_id, changes in intervention.items():
-            idx = zones_copy[zones_copy['zone_id'] == zone_id].index[0]
             for k, v in changes.items():
                 if k == 'traffic_flow':
-                    # Update traffic file for this zone/day
-                    traffic.loc[(traffic['zone_id'] == zone_id) & (traffic['day'] == day), 'traffic_flow'] = v
+                    # Update traffic for this zone/day
+                    day_flow[traffic_row[zone_id]] = v
                 else:
-                    zones_copy.at[idx, k] = v
-        results = []
-        for i, zone in zones_copy.iterrows():
-            tflow = traffic[(traffic['zone_id'] == zone['zone_id']) & (traffic['day'] == day)]['traffic_flow'].values[0]
-            energy = compute_energy_demand(zone, temp)
-            aqi = compute_aqi(zone, tflow, {'temperature': temp})
-            heat = compute_heat_island(zone)
-            results.append({'zone_id': zone['zone_id'], 'energy': energy, 'aqi': aqi, 'heat_island': heat})
-        df = pd.DataFrame(results)
-        all_results.append(df)
-    return all_results
+                    if not grid[k].flags.writeable:
+                        grid[k] = grid[k].copy()
+                    grid[k][i, zone_pos[zone_id]] = v
+        tflow[i] = day_flow[zone_rows]
+    
+    # The models are plain arithmetic on zone['col'], so all scenarios run in one call each
+    energy = compute_energy_demand(grid, temp)
+    aqi = compute_aqi(grid, tflow, {'temperature': temp})
+    heat = compute_heat_island(grid)
+    return [
+        pd.DataFrame({'zone_id': grid['zone_id'][i], 'energy': energy[i], 'aqi': aqi[i], 'heat_island': heat[i]})
+        for i in range(n)
+    ]
 
-if __name__ == '__main__':
+def write_results_csv(df, path):
+    # csv.writer formats floats with repr, same text as DataFrame.to_csv without its per-cell formatter
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f, lineterminator='\n')
+        writer.writerow(df.columns)
+        writer.writerows(df.to_numpy().tolist())
+
+def main():
     results = run_interventions()
     for i, df in enumerate(results):
         print(f'Intervention {i+1}')
         print(df)
-        df.to_csv(f'outputs/intervention_{i+1}_results.csv', index=False)
+        write_results_csv(df, f'outputs/intervention_{i+1}_results.csv')
+
+if __name__ == '__main__':
+    main()
@@ -1,9 +1,90 @@
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Tuple, Optional
+from collections.abc import MutableMapping
 import heapq
 from math import radians, cos, sin, asin, sqrt
 
+# Segment fields held as CorridorNetwork column arrays, mapped to their attribute names
+_ARRAY_FIELDS = {
+    'length_km': '_length',
+    'lanes': '_lanes',
+    'speed_limit_kmh': '_speed_limit',
+    'current_flow': '_current_flow',
+    'current_speed': '_current_speed',
+    'queue_length': '_queue_length',
+}
+
+class _SegmentRecord(MutableMapping):
+    """
+    Dict-like view of one segment. Array-backed fields read and write the
+    network's columns (as Python scalars); everything else lives in the record.
+    """
+    __slots__ = ('_network', '_idx', '_fields')
+    
+    def __init__(self, network: 'CorridorNetwork', idx: int, fields: Dict):
+        self._network = network
+        self._idx = idx
+        self._fields = fields  # array-backed keys map to None, keeping the original key order
+    
+    def __getitem__(self, key):
+        attr = _ARRAY_FIELDS.get(key)
+        if attr is not None:
+            return getattr(self._network, attr)[self._idx].item()
+        return self._fields[key]
+    
+    def __setitem__(self, key, value):
+        attr = _ARRAY_FIELDS.get(key)
+        if attr is not None:
+            getattr(self._network, attr)[self._idx] = value
+        else:
+            self._fields[key] = value
+    
+    def __delitem__(self, key):
+        if key in _ARRAY_FIELDS:
+            raise KeyError(f"{key} is a network column and cannot be removed")
+        del self._fields[key]
+    
+    def __iter__(self):
+        return iter(self._fields)
+    
+    def __len__(self):
+        return len(self._fields)
+    
+    def __repr__(self):
+        return repr(dict(self))
+
+def _dijkstra_csr(indptr: List[int], indices: List[int], weights: List[float],
+                  src: int, dst: int = -1) -> Tuple[List[float], List[int]]:
+    """
+    Dijkstra over a CSR graph (plain lists) from node index src.
+    Stops once dst is settled; dst=-1 searches the whole graph.
+    
+    Returns:
+        (dist, parent_edge) per node index; unreached nodes have inf / -1
+    """
+    inf = float('inf')
+    dist = [inf] * (len(indptr) - 1)
+    parent_edge = [-1] * (len(indptr) - 1)
+    dist[src] = 0
+    pq = [(0, src)]
+    
+    while pq:
+        curr_dist, u = heapq.heappop(pq)
+        if curr_dist > dist[u]:
+            continue
+        if u == dst:
+            break
+        for e in range(indptr[u], indptr[u + 1]):
+            v = indices[e]
+            new_dist = curr_dist + weights[e]
+            if new_dist < dist[v]:
+                dist[v] = new_dist
+                parent_edge[v] = e
+                heapq.heappush(pq, (new_dist, v))
+    
+    return dist, parent_edge
+
 class CorridorNetwork:
     """
     Graph-based corridor network for Delhi traffic simulation.
@@ -25,36 +106,37 @@ class CorridorNetwork:
         
         # Build graph structure
         self.graph = {}  # Dict[str, List[str]] - adjacency list
-        self.segment_data = {}  # Dict[str, Dict] - segment properties
+        self._segment_data = None  # Dict[str, _SegmentRecord], built on first use of segment_data
         self.intersection_data = {}  # Dict[str, Dict] - intersection properties
         self.precomputed_paths = {}  # Cache for shortest paths
+        self._csr = None  # CSR lists of self.graph for routing, rebuilt after closures
+        # (V x V) shortest-path tables from precompute_all_pairs; row s is filled when _apsp_has_row[s]
+        self._apsp_dist = None
+        self._apsp_parent_edge = None
+        self._apsp_has_row = None
         
         self._build_graph()
         self._build_intersection_data()
         
     def _build_graph(self):
-        """Build adjacency list and segment data from CSV."""
-        for _, row in self.segments_df.iterrows():
-            seg_id = row['segment_id']
-            from_int = row['from_intersection']
-            to_int = row['to_intersection']
-            
-            # Store segment data
-            self.segment_data[seg_id] = {
-                'from': from_int,
-                'to': to_int,
-                'length_km': row['length_km'],
-                'lanes': row['lanes'],
-                'speed_limit_kmh': row['speed_limit_kmh'],
-                'is_one_way': row['is_one_way'],
-                'zone_id': row['zone_id'],
-                'road_type': row['road_type'],
-                'road_name': row['road_name'],
-                'current_flow': 0,  # vehicles/hour
-                'current_speed': row['speed_limit_kmh'],  # km/h (will be updated by simulator)
-                'queue_length': 0,  # vehicles
-            }
-            
+        """Build adjacency list and per-segment column arrays from CSV."""
+        df = self.segments_df
+        # Segment attributes as parallel arrays, row i <-> self._seg_ids[i]
+        self._seg_ids = df['segment_id'].to_numpy()
+        self._seg_idx = {seg_id: i for i, seg_id in enumerate(self._seg_ids.tolist())}
+        self._length = df['length_km'].to_numpy(np.float64)
+        self._lanes = df['lanes'].to_numpy(np.int16)
+        self._speed_limit = df['speed_limit_kmh'].to_numpy(np.int16)
+        self._zone_codes, self._zone_categories = pd.factorize(df['zone_id'])
+        self._zone_code = {zone: i for i, zone in enumerate(self._zone_categories)}
+        # Dynamic state, updated by the simulator
+        self._current_flow = np.zeros(len(df))  # vehicles/hour
+        self._current_speed = self._speed_limit.astype(np.float64)  # km/h
+        self._queue_length = np.zeros(len(df))  # vehicles
+        
+        # Plain column lists: one tuple per row instead of a Series
+        cols = [df[c].tolist() for c in ('segment_id', 'from_intersection', 'to_intersection')]
+        for seg_id, from_int, to_int in zip(*cols):
             # Build adjacency list (directed)
             if from_int not in self.graph:
                 self.graph[from_int] = []
@@ -62,18 +144,87 @@ class CorridorNetwork:
             
     def _build_intersection_data(self):
         """Build intersection metadata."""
-        for _, row in self.intersections_df.iterrows():
-            int_id = row['intersection_id']
+        cols = [self.intersections_df[c].tolist() for c in (
+            'intersection_id', 'latitude', 'longitude', 'has_signal', 'cycle_time_sec',
+            'green_time_sec', 'road_name', 'zone_id')]
+        for int_id, lat, lon, has_signal, cycle_time, green_time, road_name, zone in zip(*cols):
             self.intersection_data[int_id] = {
-                'lat': row['latitude'],
-                'lon': row['longitude'],
-                'has_signal': row['has_signal'],
-                'cycle_time_sec': row['cycle_time_sec'],
-                'green_time_sec': row['green_time_sec'],
-                'road_name': row['road_name'],
-                'zone_id': row['zone_id'],
+                'lat': lat,
+                'lon': lon,
+                'has_signal': has_signal,
+                'cycle_time_sec': cycle_time,
+                'green_time_sec': green_time,
+                'road_name': road_name,
+                'zone_id': zone,
             }
     
+    @property
+    def segment_data(self) -> Dict[str, _SegmentRecord]:
+        """Per-segment dict views over the column arrays, built the first time a caller asks."""
+        if self._segment_data is None:
+            cols = [self.segments_df[c].tolist() for c in (
+                'from_intersection', 'to_intersection', 'is_one_way', 'zone_id', 'road_type', 'road_name')]
+            self._segment_data = {}
+            for i, (from_int, to_int, one_way, zone, road_type, road_name) in enumerate(zip(*cols)):
+                fields = {
+                    'from': from_int,
+                    'to': to_int,
+                    'length_km': None,
+                    'lanes': None,
+                    'speed_limit_kmh': None,
+                    'is_one_way': one_way,
+                    'zone_id': zone,
+                    'road_type': road_type,
+                    'road_name': road_name,
+                    'current_flow': None,
+                    'current_speed': None,
+                    'queue_length': None,
+                }
+                self._segment_data[self._seg_ids[i]] = _SegmentRecord(self, i, fields)
+        return self._segment_data
+    
+    def _build_csr(self):
+        """
+        CSR copy of the adjacency list for routing: edges of node u are
+        indptr[u]:indptr[u+1] in indices (head node), weights (km) and edge_seg
+        (segment index). Nodes are numbered in sorted ID order, so heap ties
+        break exactly as they did on the ID strings.
+        """
+        nodes = set(self.intersection_data) | set(self.graph)
+        nodes.update(to_int for edges in self.graph.values() for to_int, _ in edges)
+        self.int_ids = sorted(nodes)
+        self.int_idx = {int_id: i for i, int_id in enumerate(self.int_ids)}
+        
+        counts = np.zeros(len(self.int_ids), dtype=np.int32)
+        heads, segs = [], []
+        for int_id in self.int_ids:
+            edges = self.graph.get(int_id, [])
+            counts[self.int_idx[int_id]] = len(edges)
+            heads.extend(self.int_idx[to_int] for to_int, _ in edges)
+            segs.extend(self._seg_idx[seg_id] for _, seg_id in edges)
+        
+        self.indptr = np.concatenate(([0], np.cumsum(counts))).astype(np.int32)
+        self.indices = np.array(heads, dtype=np.int32)
+        self.edge_seg = np.array(segs, dtype=np.int32)
+        # float64 like length_km, so path distances match summing the segment lengths
+        self.weights = self._length[self.edge_seg]
+        self.edge_src = np.repeat(np.arange(len(self.int_ids), dtype=np.int32), counts)
+        # The search loop and path walks run on lists: indexing them is much cheaper than NumPy scalars
+        self._csr = (self.indptr.tolist(), self.indices.tolist(), self.weights.tolist())
+        self._edge_tail = self.edge_src.tolist()
+        self._edge_seg_id = self._seg_ids[self.edge_seg].tolist()
+    
+    def _path_segments(self, parent_edge: List[int], dst: int) -> List[str]:
+        """Segment IDs from the search source to node index dst."""
+        edge_tail, edge_seg_id = self._edge_tail, self._edge_seg_id
+        path = []
+        e = parent_edge[dst]
+        while e != -1:
+            path.append(edge_seg_id[e])
+            e = parent_edge[edge_tail[e]]
+        path.reverse()
+        return path
+    
     def _haversine_distance(self, lat1, lon1, lat2, lon2) -> float:
         """Calculate distance between two lat/lon points in km."""
         lat1, lon1, lat2, lon2 = map(radians, [lat1, lon1, lat2, lon2])
@@ -84,6 +235,51 @@ class CorridorNetwork:
         r = 6371  # Earth radius in km
         return c * r
     
+    def precompute_all_pairs(self, sources: Optional[List[str]] = None):
+        """
+        Run a full shortest-path search from every intersection (or only from
+        sources, e.g. the OD origins) and keep the distance and parent-edge
+        tables. Routing queries from those sources then read a table row
+        instead of searching. Dropped, like the path cache, when the network changes.
+        
+        Args:
+            sources: Origin intersection IDs; None for all intersections
+        """
+        if self._csr is None:
+            self._build_csr()
+        n = len(self.int_ids)
+        if self._apsp_dist is None:
+            self._apsp_dist = np.full((n, n), np.inf)
+            self._apsp_parent_edge = np.full((n, n), -1, dtype=np.int32)
+            self._apsp_has_row = np.zeros(n, dtype=bool)
+        
+        if sources is None:
+            rows = range(n)
+        else:
+            rows = [self.int_idx[s] for s in sources if s in self.int_idx]
+        for src in rows:
+            if not self._apsp_has_row[src]:
+                dist, parent_edge = _dijkstra_csr(*self._csr, src)
+                self._apsp_dist[src] = dist
+                self._apsp_parent_edge[src] = parent_edge
+                self._apsp_has_row[src] = True
+    
+    def _search(self, src: int, dst: int = -1) -> Tuple[List[float], List[int]]:
+        """(dist, parent_edge) lists from node index src: a precomputed table row, else a search."""
+        if self._apsp_has_row is not None and self._apsp_has_row[src]:
+            dist = self._apsp_dist[src].tolist()
+            dist[src] = 0  # as the search leaves it
+            return dist, self._apsp_parent_edge[src].tolist()
+        return _dijkstra_csr(*self._csr, src, dst)
+    
+    def _invalidate_routes(self):
+        """Drop cached paths, the CSR graph and precomputed tables after a network change."""
+        self.precomputed_paths.clear()
+        self._csr = None
+        self._apsp_dist = None
+        self._apsp_parent_edge = None
+        self._apsp_has_row = None
+    
     def dijkstra(self, origin: str, destination: str) -> Tuple[List[str], float]:
         """
         Find shortest path from origin to destination using Dijkstra.
@@ -99,49 +295,100 @@ class CorridorNetwork:
         if cache_key in self.precomputed_paths:
             return self.precomputed_paths[cache_key]
         
-        # Dijkstra's algorithm on segment graph
-        distances = {origin: 0}
-        parent = {origin: None}
-        parent_segment = {origin: None}
-        pq = [(0, origin)]
+        if self._csr is None:
+            self._build_csr()
+        src = self.int_idx.get(origin)
+        dst = self.int_idx.get(destination)
+        if src is None or dst is None:
+            if origin != destination:
+                return ([], float('inf'))
+            result = ([], 0)  # an unknown node still reaches itself
+        else:
+            dist, parent_edge = self._search(src, dst)
+            if parent_edge[dst] == -1 and dst != src:
+                # No path found
+                return ([], float('inf'))
+            result = (self._path_segments(parent_edge, dst), dist[dst])
+        
+        self.precomputed_paths[cache_key] = result
+        return result
+    
+    def dijkstra_multi(self, origin: str) -> Tuple[Dict[str, float], Dict[str, Tuple[str, str]]]:
+        """
+        Single-source Dijkstra from origin to every reachable intersection.
         
-        while pq:
-            curr_dist, curr_node = heapq.heappop(pq)
+        Args:
+            origin: Origin intersection ID
             
-            if curr_dist > distances.get(curr_node, float('inf')):
-                continue
+        Returns:
+            (distances_km, prev) where prev maps node -> (parent_node, segment_id)
+        """
+        if self._csr is None:
+            self._build_csr()
+        src = self.int_idx.get(origin)
+        if src is None:
+            return {origin: 0}, {}
+        
+        dist, parent_edge = self._search(src)
+        distances = {self.int_ids[v]: d for v, d in enumerate(dist) if d != float('inf')}
+        prev = {
+            self.int_ids[v]: (self.int_ids[self._edge_tail[e]], self._edge_seg_id[e])
+            for v, e in enumerate(parent_edge) if e != -1
+        }
+        return distances, prev
+    
+    def reconstruct_path(self, prev: Dict[str, Tuple[str, str]], destination: str) -> List[str]:
+        """Rebuild the segment path to destination from a dijkstra_multi prev map."""
+        path_segments = []
+        node = destination
+        while node in prev:
+            node, seg_id = prev[node]
+            path_segments.append(seg_id)
+        path_segments.reverse()
+        return path_segments
+    
+    def shortest_paths(self, od_pairs: List[Tuple[str, str]]) -> Dict[Tuple[str, str], Tuple[List[str], float]]:
+        """
+        Batched shortest paths: one single-source search per unique origin.
+        
+        Args:
+            od_pairs: (origin, destination) intersection ID pairs
             
-            if curr_node == destination:
-                # Reconstruct path
-                path_segments = []
-                node = destination
-                while parent[node] is not None:
-                    path_segments.append(parent_segment[node])
-                    node = parent[node]
-                path_segments.reverse()
-                total_dist = distances[destination]
-                
-                self.precomputed_paths[cache_key] = (path_segments, total_dist)
-                return (path_segments, total_dist)
+        Returns:
+            Dict mapping (origin, destination) -> (path_segment_ids, total_distance_km)
+        """
+        destinations_by_origin = {}
+        for origin, destination in od_pairs:
+            destinations_by_origin.setdefault(origin, []).append(destination)
+        
+        results = {}
+        for origin, destinations in destinations_by_origin.items():
+            missing = [d for d in destinations if (origin, d) not in self.precomputed_paths]
+            if missing:
+                if self._csr is None:
+                    self._build_csr()
+                src = self.int_idx.get(origin)
+                if src is None:
+                    if origin in missing:
+                        self.precomputed_paths[(origin, origin)] = ([], 0)
+                else:
+                    dist, parent_edge = self._search(src)
+                    for destination in missing:
+                        dst = self.int_idx.get(destination)
+                        if dst is not None and dist[dst] != float('inf'):
+                            self.precomputed_paths[(origin, destination)] = (
+                                self._path_segments(parent_edge, dst), dist[dst])
             
-            # Explore neighbors
-            if curr_node in self.graph:
-                for next_node, seg_id in self.graph[curr_node]:
-                    seg_length = self.segment_data[seg_id]['length_km']
-                    new_dist = curr_dist + seg_length
-                    
-                    if new_dist < distances.get(next_node, float('inf')):
-                        distances[next_node] = new_dist
-                        parent[next_node] = curr_node
-                        parent_segment[next_node] = seg_id
-                        heapq.heappush(pq, (new_dist, next_node))
-        
-        # No path found
-        return ([], float('inf'))
+            for destination in destinations:
+                results[(origin, destination)] = self.precomputed_paths.get(
+                    (origin, destination), ([], float('inf')))
+        
+        return results
     
     def get_segment(self, segment_id: str) -> Dict:
-        """Get segment data."""
-        return self.segment_data.get(segment_id, {})
+        """Get segment data (a plain dict snapshot)."""
+        record = self.segment_data.get(segment_id)
+        return dict(record) if record is not None else {}
     
     def get_intersection(self, intersection_id: str) -> Dict:
         """Get intersection data."""
@@ -149,8 +396,10 @@ class CorridorNetwork:
     
     def get_segments_in_zone(self, zone_id: str) -> List[str]:
         """Get all segments in a zone."""
-        return [seg_id for seg_id, data in self.segment_data.items() 
-                if data['zone_id'] == zone_id]
+        code = self._zone_code.get(zone_id)
+        if code is None:
+            return []
+        return self._seg_ids[self._zone_codes == code].tolist()
     
     def update_segment_lanes(self, segment_id: str, new_lanes: int):
         """
@@ -162,7 +411,7 @@ class CorridorNetwork:
             self.segment_data[segment_id]['lanes'] = new_lanes
             print(f"[INFRA] Updated {segment_id} lanes: {old_lanes} → {new_lanes}")
             # Clear path cache as capacity changed
-            self.precomputed_paths.clear()
+            self._invalidate_routes()
             return True
         return False
     
@@ -186,7 +435,7 @@ class CorridorNetwork:
             self.graph[from_int] = [(n, s) for n, s in self.graph[from_int] if s != segment_id]
         
         print(f"[INFRA] Closed segment {segment_id}: {from_int} → {to_int}")
-        self.precomputed_paths.clear()
+        self._invalidate_routes()
         return True
     
     def reopen_segment(self, segment_id: str):
@@ -208,7 +457,7 @@ class CorridorNetwork:
         self.graph[from_int].append((to_int, segment_id))
         
         print(f"[INFRA] Reopened segment {segment_id}")
-        self.precomputed_paths.clear()
+        self._invalidate_routes()
         return True
     
     def update_signal_timing(self, intersection_id: str, green_time_delta: int):
@@ -234,17 +483,15 @@ class CorridorNetwork:
         Get complete network topology.
         Useful for validation and visualization.
         """
+        zone_counts = np.bincount(self._zone_codes, minlength=len(self._zone_categories))
         return {
-            'segments': len(self.segment_data),
+            'segments': len(self._seg_ids),
             'intersections': len(self.intersection_data),
-            'zones': len(set(s['zone_id'] for s in self.segment_data.values())),
-            'total_length_km': sum(s['length_km'] for s in self.segment_data.values()),
-            'total_lanes': sum(s['lanes'] for s in self.segment_data.values()),
+            'zones': len(self._zone_categories),
+            'total_length_km': float(self._length.sum()),
+            'total_lanes': int(self._lanes.sum()),
             'signalized_intersections': sum(1 for i in self.intersection_data.values() if i['has_signal']),
-            'segments_by_zone': {
-                zone: len([s for s in self.segment_data.values() if s['zone_id'] == zone])
-                for zone in set(s['zone_id'] for s in self.segment_data.values())
-            }
+            'segments_by_zone': dict(zip(self._zone_categories.tolist(), zone_counts.tolist())),
         }
     
     def validate_network(self) -> Dict:
@@ -313,14 +560,15 @@ class CorridorNetwork:
     
     def update_segment_state(self, segment_id: str, flow: float, speed: float, queue: float):
         """Update dynamic segment state (flow, speed, queue)."""
-        if segment_id in self.segment_data:
-            self.segment_data[segment_id]['current_flow'] = flow
-            self.segment_data[segment_id]['current_speed'] = speed
-            self.segment_data[segment_id]['queue_length'] = queue
+        i = self._seg_idx.get(segment_id)
+        if i is not None:
+            self._current_flow[i] = flow
+            self._current_speed[i] = speed
+            self._queue_length[i] = queue
     
     def get_all_segments(self) -> List[str]:
         """Get list of all segment IDs."""
-        return list(self.segment_data.keys())
+        return self._seg_ids.tolist()
     
     def get_all_intersections(self) -> List[str]:
         """Get list of all intersection IDs."""
@@ -3,6 +3,10 @@ import pandas as pd
 from typing import Dict, List
 from src.models.traffic_simulator import TrafficSimulator
 
+def _factor_matrix(factors: Dict, vehicle_types, pollutants) -> np.ndarray:
+    """(vehicle_types x pollutants) array of a {vehicle type: {pollutant: g/km}} table"""
+    return np.array([[factors[v][p] for p in pollutants] for v in vehicle_types])
+
 class EmissionsModel:
     """
     Compute vehicle emissions and zone-level AQI impact from traffic.
@@ -14,6 +18,11 @@ class EmissionsModel:
         'Car': {'PM25': 0.5, 'NOx': 0.8, 'CO': 2.5, 'CO2': 180},  # 0.5g/km PM2.5 (includes re-suspension)
         'Truck': {'PM25': 2.5, 'NOx': 5.0, 'CO': 8.0, 'CO2': 950},  # 2.5g/km for trucks
     }
+    POLLUTANTS = ('PM25', 'NOx', 'CO', 'CO2')
+    # EMISSION_FACTORS as a matrix (rows: Car, Truck; columns: POLLUTANTS) and the assumed
+    # 70% car / 30% truck split of segment flow
+    _EF = _factor_matrix(EMISSION_FACTORS, ('Car', 'Truck'), POLLUTANTS)
+    _MIX = np.array([0.7, 0.3])
     
     # Zone background AQI (baseline before traffic contribution)
     ZONE_BACKGROUND_AQI = {
@@ -30,6 +39,9 @@ class EmissionsModel:
         """
         self.simulator = simulator
         self.network = simulator.network
+        self._zone_segment_counts = np.bincount(
+            self.network._zone_codes, minlength=len(self.network._zone_categories))
+        self._zone_totals_cache = None  # (segment results it was computed from, grams, vehicles)
     
     def compute_segment_emissions(self, segment_id: str) -> Dict:
         """
@@ -45,34 +57,52 @@ class EmissionsModel:
         if not seg_results:
             return {}
         
-        seg = self.network.get_segment(segment_id)
         flow = seg_results['flow_vph']
-        length = seg['length_km']
-        
-        # Assume 70% cars, 30% trucks in flow
-        car_flow = flow * 0.7
-        truck_flow = flow * 0.3
-        
-        # Daily emissions (vehicles per day = flow * 24 hours)
-        daily_vehicles = {
-            'Car': car_flow * 24,
-            'Truck': truck_flow * 24,
-        }
+        length = self.network.get_segment(segment_id)['length_km']
+        grams = self._emissions_grams(np.array([flow]), np.array([length]))[0]
         
-        emissions = {
-            'PM25': 0, 'NOx': 0, 'CO': 0, 'CO2': 0,
+        emissions = dict(zip(self.POLLUTANTS, grams.tolist()))
+        emissions.update({
             'segment_id': segment_id,
             'length_km': length,
             'daily_vehicles': flow * 24,
-        }
-        
-        for vtype, daily_count in daily_vehicles.items():
-            vehicle_km = daily_count * length
-            for pollutant, factor in self.EMISSION_FACTORS[vtype].items():
-                emissions[pollutant] += vehicle_km * factor  # grams
-        
+        })
         return emissions
     
+    def _emissions_grams(self, flow: np.ndarray, length: np.ndarray) -> np.ndarray:
+        """
+        Daily grams of each pollutant for segments with the given flows (veh/hour)
+        and lengths (km), as a (segments x POLLUTANTS) array.
+        """
+        # Vehicle-km per day by type (vehicles per day = flow * 24 hours)
+        vehicle_km = flow[:, None] * self._MIX * 24 * length[:, None]
+        # Car and truck terms added explicitly rather than through a matmul, which may fuse
+        # them and round differently from the per-segment sums
+        return vehicle_km[:, :1] * self._EF[0] + vehicle_km[:, 1:] * self._EF[1]
+    
+    def _zone_totals(self):
+        """
+        Emissions of every segment summed per zone, computed once per simulation result.
+        
+        Returns:
+            (grams, daily_vehicles): (zones x POLLUTANTS) and (zones,) arrays indexed by
+            the network's zone codes, or None before any simulation has run
+        """
+        if not self.simulator.simulation_results:
+            return None
+        seg_results = next(iter(self.simulator.simulation_results.values()))['segments']
+        cache = self._zone_totals_cache
+        if cache is None or cache[0] is not seg_results:
+            flow = np.array([seg_results[seg_id]['flow_vph'] for seg_id in self.network.get_all_segments()])
+            grams = self._emissions_grams(flow, self.network._length)
+            # np.add.at accumulates in segment order, like the old per-segment loop
+            zone_grams = np.zeros((len(self.network._zone_categories), len(self.POLLUTANTS)))
+            np.add.at(zone_grams, self.network._zone_codes, grams)
+            zone_vehicles = np.zeros(len(self.network._zone_categories))
+            np.add.at(zone_vehicles, self.network._zone_codes, flow * 24)
+            cache = self._zone_totals_cache = (seg_results, zone_grams, zone_vehicles)
+        return cache[1], cache[2]
+    
     def compute_zone_emissions(self, zone_id: str) -> Dict:
         """
         Aggregate emissions for all segments in a zone.
@@ -83,21 +113,23 @@ class EmissionsModel:
         Returns:
             Total emissions in zone
         """
-        segments = self.network.get_segments_in_zone(zone_id)
+        code = self.network._zone_code.get(zone_id)
         
         zone_emissions = {
             'zone_id': zone_id,
             'PM25': 0, 'NOx': 0, 'CO': 0, 'CO2': 0,
             'total_vehicles': 0,
-            'num_segments': len(segments),
+            'num_segments': 0,
         }
+        if code is None:
+            return zone_emissions
         
-        for seg_id in segments:
-            seg_emissions = self.compute_segment_emissions(seg_id)
-            if seg_emissions:
-                for pollutant in ['PM25', 'NOx', 'CO', 'CO2']:
-                    zone_emissions[pollutant] += seg_emissions[pollutant]
-                zone_emissions['total_vehicles'] += seg_emissions['daily_vehicles']
+        zone_emissions['num_segments'] = self._zone_segment_counts[code].item()
+        totals = self._zone_totals()
+        if totals is not None:
+            zone_grams, zone_vehicles = totals
+            zone_emissions.update(zip(self.POLLUTANTS, zone_grams[code].tolist()))
+            zone_emissions['total_vehicles'] = zone_vehicles[code].item()
         
         return zone_emissions
     
@@ -186,9 +218,7 @@ class EmissionsModel:
         Returns:
             List of zone AQI dictionaries
         """
-        all_zones = set()
-        for seg_id, seg_data in self.network.segment_data.items():
-            all_zones.add(seg_data['zone_id'])
+        all_zones = self.network._zone_categories.tolist()
         
         zone_aqi_list = []
         for zone_id in sorted(all_zones):
@@ -29,8 +29,9 @@ class TrafficSimulator:
     def _precompute_od_paths(self):
         """Pre-compute shortest paths for all OD pairs."""
         od_pairs = self.network.od_matrix_df.groupby(['origin_intersection', 'destination_intersection']).first().index
-        for origin, destination in od_pairs:
-            path, dist = self.network.dijkstra(origin, destination)
+        # Shortest-path tables for every OD origin, reused by later route queries from them
+        self.network.precompute_all_pairs(od_pairs.unique(level=0).tolist())
+        for (origin, destination), (path, dist) in self.network.shortest_paths(list(od_pairs)).items():
             self.od_paths[(origin, destination)] = {
                 'segments': path,
                 'distance': dist,
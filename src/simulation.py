@@ -1,13 +1,21 @@
 import pandas as pd
 import numpy as np
+from functools import lru_cache
 
-# Load data
-def load_data():
+# Load data (CSVs are parsed once per process; load_data.cache_clear() forces a re-read)
+@lru_cache(maxsize=1)
+def _read_data():
     zones = pd.read_csv('data/city_zones.csv')
     weather = pd.read_csv('data/weather.csv')
     traffic = pd.read_csv('data/traffic.csv')
     return zones, weather, traffic
 
+def load_data():
+    # Copies, so callers that patch the frames in place never touch the cached ones
+    return tuple(df.copy() for df in _read_data())
+
+load_data.cache_clear = _read_data.cache_clear
+
 # Energy demand model (simple linear)
 def compute_energy_demand(zone, temp):
     # Example: cooling demand increases with temp, building age, and population
@@ -41,17 +49,21 @@ def apply_intervention(zone, intervention):
             zone[k] = v
     return zone
 
-if __name__ == '__main__':
+def main():
     zones, weather, traffic = load_data()
     day = 1
     temp = weather.loc[weather['day'] == day, 'temperature'].values[0]
-    results = []
-    for i, zone in zones.iterrows():
-        tflow = traffic[(traffic['zone_id'] == zone['zone_id']) & (traffic['day'] == day)]['traffic_flow'].values[0]
-        energy = compute_energy_demand(zone, temp)
-        aqi = compute_aqi(zone, tflow, {'temperature': temp})
-        heat = compute_heat_island(zone)
-        results.append({'zone_id': zone['zone_id'], 'energy': energy, 'aqi': aqi, 'heat_island': heat})
-    df = pd.DataFrame(results)
+    # Raw column arrays instead of one Series per row; the models run on all zones at once
+    zone = {col: zones[col].to_numpy(dtype=float) for col in zones.columns}
+    tflow = traffic[traffic['day'] == day].set_index('zone_id')['traffic_flow'].reindex(zones['zone_id']).to_numpy()
+    df = pd.DataFrame({
+        'zone_id': zone['zone_id'],
+        'energy': compute_energy_demand(zone, temp),
+        'aqi': compute_aqi(zone, tflow, {'temperature': temp}),
+        'heat_island': compute_heat_island(zone),
+    })
     print(df)
     df.to_csv('outputs/baseline_results.csv', index=False)
+
+if __name__ == '__main__':
+    main()
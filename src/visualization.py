@@ -29,10 +29,13 @@ def plot_comparison(baseline, intervention, value_col, title):
     plt.legend()
     plt.show()
 
-if __name__ == '__main__':
+def main():
     baseline = pd.read_csv('outputs/baseline_results.csv')
     intervention = pd.read_csv('outputs/intervention_1_results.csv')
     plot_heatmap(baseline, 'aqi', 'Baseline AQI Heatmap')
     plot_heatmap(intervention, 'aqi', 'Intervention AQI Heatmap')
     plot_comparison(baseline, intervention, 'energy', 'Energy Use: Baseline vs. Intervention')
     plot_comparison(baseline, intervention, 'heat_island', 'Heat Island: Baseline vs. Intervention')
+
+if __name__ == '__main__':
+    main()